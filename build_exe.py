@@ -1,28 +1,53 @@
 import os
 import sys
+import hashlib
+import importlib.util
 import struct
 import subprocess
+from functools import lru_cache
 from pathlib import Path
 
 APP_NAME = "HumanTextEditor"
-PROJECT_ROOT = Path(__file__).resolve().parent
+_SELF = Path(__file__).resolve()
+PROJECT_ROOT = _SELF.parent
 ICON_PATH = PROJECT_ROOT / "assets" / "icon.ico"
 SCRIPT_PATH = PROJECT_ROOT / "human_editor.py"
+RESOURCES_PATH = PROJECT_ROOT / "resources_rc.py"
+VENV_DIR = PROJECT_ROOT / ".venv"
+PYI_CACHE_DIR = PROJECT_ROOT / ".pyinstaller-cache"
+DIST_DIR = PROJECT_ROOT / "dist"
+SPEC_DIR = PROJECT_ROOT / "build" / "specs"
+BUILD_PACKAGES = {"PyInstaller": "pyinstaller", "keyboard": "keyboard"}
 
+ICON_SIZE = 64
+ICON_BGRA = bytes([0x4C, 0x7A, 0xF1, 0xFF])  # soft blue
 
-def generate_icon(path: str):
-    os.makedirs(os.path.dirname(path), exist_ok=True)
 
-    width = 64
-    height = 64
-    bpp = 32
+def _mask_bytes(width: int, height: int) -> bytes:
+    mask_row_bytes = ((width + 31) // 32) * 4
+    return b"\x00" * (mask_row_bytes * height)
 
-    # BGRA color (soft blue)
-    pixel = bytes([0x4C, 0x7A, 0xF1, 0xFF])
-    pixels = pixel * (width * height)
 
-    mask_row_bytes = ((width + 31) // 32) * 4
-    mask = b"\x00" * (mask_row_bytes * height)
+# ICO/BMP on-disk layouts, compiled once.
+_BMP_HDR = struct.Struct("<IIIHHIIIIII")  # BITMAPINFOHEADER
+_ICONDIR = struct.Struct("<HHH")
+_ICONDIRENTRY = struct.Struct("<BBBBHHII")
+
+# Pixel and AND-mask buffers for the default icon, built once at import.
+_PIXELS = ICON_BGRA * (ICON_SIZE * ICON_SIZE)
+_MASK = _mask_bytes(ICON_SIZE, ICON_SIZE)
+
+
+@lru_cache(maxsize=8)
+def _icon_bytes(width: int, height: int, bgra: bytes) -> bytes:
+    bpp = 32
+
+    if (width, height, bgra) == (ICON_SIZE, ICON_SIZE, ICON_BGRA):
+        pixels = _PIXELS
+        mask = _MASK
+    else:
+        pixels = bgra * (width * height)
+        mask = _mask_bytes(width, height)
 
     biSize = 40
     biWidth = width
@@ -36,8 +61,7 @@ def generate_icon(path: str):
     biClrUsed = 0
     biClrImportant = 0
 
-    bmp_header = struct.pack(
-        "<IIIHHIIIIII",
+    bmp_header = _BMP_HDR.pack(
         biSize,
         biWidth,
         biHeight,
@@ -54,11 +78,10 @@ def generate_icon(path: str):
     image_data = bmp_header + pixels + mask
 
     # ICONDIR
-    icon_dir = struct.pack("<HHH", 0, 1, 1)
+    icon_dir = _ICONDIR.pack(0, 1, 1)
 
     # ICONDIRENTRY
-    entry = struct.pack(
-        "<BBBBHHII",
+    entry = _ICONDIRENTRY.pack(
         width if width < 256 else 0,
         height if height < 256 else 0,
         0,  # color count
@@ -66,62 +89,165 @@ def generate_icon(path: str):
         1,  # planes
         bpp,
         len(image_data),
-        6 + 16,  # offset
+        _ICONDIR.size + _ICONDIRENTRY.size,  # offset
     )
 
-    with open(path, "wb") as f:
-        f.write(icon_dir)
-        f.write(entry)
-        f.write(image_data)
+    data = bytearray(icon_dir)
+    data += entry
+    data += image_data
+    return bytes(data)
+
+
+def build_icon_bytes() -> bytes:
+    return _icon_bytes(ICON_SIZE, ICON_SIZE, ICON_BGRA)
+
 
+def generate_icon(path: str | Path) -> bool:
+    """Write the icon only when its bytes differ, so the mtime stays stable."""
+    target = Path(path)
+    data = build_icon_bytes()
+    if target.exists() and target.read_bytes() == data:
+        return False
+    target.parent.mkdir(parents=True, exist_ok=True)
+    target.write_bytes(data)
+    return True
 
-def ensure_pyinstaller():
+
+def _is_installed(module: str) -> bool:
+    # find_spec locates the package without executing its __init__.
     try:
-        import PyInstaller  # noqa: F401
-        return
-    except Exception:
-        subprocess.check_call([sys.executable, "-m", "pip", "install", "pyinstaller"])
+        return importlib.util.find_spec(module) is not None
+    except (ImportError, ValueError):
+        return False
+
+
+def ensure_packages(packages: dict[str, str]):
+    """Install any missing build packages ({module: pip name}) in one pip call."""
+    missing = [pip_name for module, pip_name in packages.items() if not _is_installed(module)]
+    # One resolver pass for everything: concurrent pip processes writing the
+    # same site-packages can clobber each other's shared dependencies.
+    if missing:
+        env = os.environ.copy()
+        env["PIP_DISABLE_PIP_VERSION_CHECK"] = "1"
+        subprocess.check_call(
+            [
+                sys.executable,
+                "-m",
+                "pip",
+                "install",
+                "--disable-pip-version-check",
+                "--no-input",
+                "--only-binary=:all:",
+                *missing,
+            ],
+            env=env,
+        )
+
+
+def _bootstrap_key() -> str:
+    packages = "|".join(sorted(BUILD_PACKAGES))
+    return hashlib.sha256(f"{sys.version}|{packages}".encode("utf-8")).hexdigest()
 
 
-def ensure_keyboard():
+def _bootstrap_sentinel() -> Path | None:
+    """Sentinel path inside the project venv, or None when not running in it."""
     try:
-        import keyboard  # noqa: F401
-        return
-    except Exception:
-        subprocess.check_call([sys.executable, "-m", "pip", "install", "keyboard"])
+        in_venv = Path(sys.prefix).resolve() == VENV_DIR.resolve()
+    except OSError:
+        return None
+    return VENV_DIR / ".hte_bootstrapped" if in_venv else None
 
 
 def ensure_venv_python():
     """If a local .venv exists, re-run this script with that interpreter."""
-    venv_python = PROJECT_ROOT / ".venv" / "Scripts" / "python.exe"
+    if sys.platform == "win32":
+        venv_python = VENV_DIR / "Scripts" / "python.exe"
+    else:
+        venv_python = VENV_DIR / "bin" / "python"
     if not venv_python.exists():
         return
     current = Path(sys.executable).resolve()
     target = venv_python.resolve()
     if current != target:
-        args = [str(target), str(Path(__file__).resolve())] + sys.argv[1:]
-        raise SystemExit(subprocess.call(args, cwd=str(PROJECT_ROOT)))
+        args = [str(target), str(_SELF)] + sys.argv[1:]
+        if sys.platform == "win32":
+            # Windows' execv spawns a new process and returns to the caller
+            # immediately, losing the exit code, so keep the child in-band.
+            raise SystemExit(subprocess.call(args, cwd=str(PROJECT_ROOT)))
+        os.chdir(PROJECT_ROOT)
+        os.execv(str(target), args)
+
+
+def _iter_input_files():
+    # ICON_PATH lives under assets/, so walking that tree covers it.
+    yield SCRIPT_PATH
+    yield RESOURCES_PATH
+    stack = [PROJECT_ROOT / "assets"]
+    while stack:
+        with os.scandir(stack.pop()) as it:
+            for entry in sorted(it, key=lambda e: e.name):
+                if entry.is_dir():
+                    stack.append(Path(entry.path))
+                elif entry.is_file():
+                    yield Path(entry.path)
+
+
+def _inputs_hash(args: list[str]) -> str:
+    """SHA-256 over the build inputs and PyInstaller arguments."""
+    h = hashlib.sha256()
+    h.update("\0".join(args).encode("utf-8"))
+    for path in _iter_input_files():
+        h.update(str(path.relative_to(PROJECT_ROOT)).encode("utf-8"))
+        h.update(path.read_bytes())
+    return h.hexdigest()
+
+
+def _read_stamp(path: Path) -> str | None:
+    try:
+        return path.read_text("utf-8").strip()
+    except OSError:
+        return None
+
+
+def _has_flag(*names: str) -> bool:
+    return any(name in sys.argv[1:] for name in names)
 
 
 def build():
+    # Switch interpreters before any other work. Package probes describe the
+    # interpreter that runs them, so they only run once, in the final one.
     ensure_venv_python()
 
+    # The shipped icon is custom art; only fall back to the generated one
+    # when it is missing.
     if not ICON_PATH.exists():
-        generate_icon(str(ICON_PATH))
+        generate_icon(ICON_PATH)
 
     if not SCRIPT_PATH.exists():
         raise FileNotFoundError(f"Script not found: {SCRIPT_PATH}")
 
-    ensure_pyinstaller()
-    ensure_keyboard()
+    fresh = _has_flag("--fresh", "--rebuild")
 
-    args = [
-        sys.executable,
-        "-m",
-        "PyInstaller",
-        "--clean",
+    # Once the project venv has been bootstrapped for this interpreter
+    # version, skip probing for build packages entirely.
+    sentinel = _bootstrap_sentinel()
+    bootstrap_key = _bootstrap_key()
+    if fresh or sentinel is None or _read_stamp(sentinel) != bootstrap_key:
+        ensure_packages(BUILD_PACKAGES)
+        if sentinel is not None:
+            sentinel.write_text(bootstrap_key, "utf-8")
+
+    # One-dir builds skip the per-build compress+bundle step; --release
+    # produces the single-file exe the installer ships.
+    release = _has_flag("--release")
+    spec_args = [
         "--noconsole",
-        "--onefile",
+        "--onefile" if release else "--onedir",
+    ]
+    if not release:
+        # UPX recompresses every binary on each build; keep it for releases.
+        spec_args.append("--noupx")
+    spec_args += [
         "--name",
         APP_NAME,
         "--icon",
@@ -132,11 +258,66 @@ def build():
         "keyboard",
         str(SCRIPT_PATH),
     ]
-    subprocess.check_call(args, cwd=str(PROJECT_ROOT))
 
-    exe_path = os.path.join(PROJECT_ROOT, "dist", f"{APP_NAME}.exe")
-    if not os.path.exists(exe_path):
+    if release:
+        exe_path = DIST_DIR / f"{APP_NAME}.exe"
+    else:
+        exe_path = DIST_DIR / APP_NAME / f"{APP_NAME}.exe"
+    # One stamp per mode, so a dev build never passes for the release exe.
+    stamp_path = DIST_DIR / f".build_hash-{'release' if release else 'dev'}"
+
+    inputs_hash = _inputs_hash(spec_args)
+    if not fresh and exe_path.exists() and _read_stamp(stamp_path) == inputs_hash:
+        print(f"Build up to date: {exe_path}")
+        return
+
+    # Keep PyInstaller's binCache project-local so it survives between runs
+    # (and can be restored in CI) without sharing state with other builds.
+    env = os.environ.copy()
+    env.setdefault("PYINSTALLER_CONFIG_DIR", str(PYI_CACHE_DIR))
+
+    # Generate a spec once per flag set and build from it afterwards; pass
+    # --regenerate-spec to rewrite it from the CLI flags.
+    spec_dir = SPEC_DIR / ("release" if release else "dev")
+    spec_path = spec_dir / f"{APP_NAME}.spec"
+    spec_stamp = spec_path.with_suffix(".args")
+    spec_key = hashlib.sha256("\0".join(spec_args).encode("utf-8")).hexdigest()
+    if (
+        _has_flag("--regenerate-spec")
+        or not spec_path.exists()
+        or _read_stamp(spec_stamp) != spec_key
+    ):
+        spec_dir.mkdir(parents=True, exist_ok=True)
+        subprocess.check_call(
+            [
+                sys.executable,
+                "-m",
+                "PyInstaller.utils.cliutils.makespec",
+                "--specpath",
+                str(spec_dir),
+                *spec_args,
+            ],
+            cwd=str(PROJECT_ROOT),
+            env=env,
+        )
+        spec_stamp.write_text(spec_key, "utf-8")
+
+    # Reuse PyInstaller's cached analysis between runs; pass --fresh (or
+    # --rebuild) to wipe the work directory and force a full rebuild.
+    args = [
+        sys.executable,
+        "-m",
+        "PyInstaller",
+        "--noconfirm",
+    ]
+    if fresh:
+        args.append("--clean")
+    args.append(str(spec_path))
+    subprocess.check_call(args, cwd=str(PROJECT_ROOT), env=env)
+
+    if not exe_path.exists():
         raise FileNotFoundError(f"Build finished but {exe_path} was not found.")
+    stamp_path.write_text(inputs_hash, "utf-8")
     print(f"Build complete: {exe_path}")
 
 
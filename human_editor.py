@@ -11,8 +11,8 @@ import random
 import time
 import threading
 import difflib
-import base64
-import html
+import bisect
+import functools
 import ctypes
 from ctypes import wintypes
 from dataclasses import dataclass, field
@@ -32,6 +32,8 @@ from PySide6.QtCore import (
     QEasingCurve,
     Property,
     QUrl,
+    QRunnable,
+    QThreadPool,
 )
 from PySide6.QtGui import (
     QFont,
@@ -60,7 +62,6 @@ from PySide6.QtWidgets import (
     QLayoutItem,
     QLineEdit,
     QMainWindow,
-    QMessageBox,
     QPlainTextEdit,
     QTextEdit,
     QProgressBar,
@@ -77,6 +78,7 @@ from PySide6.QtWidgets import (
     QWidgetItem,
 )
 
+import resources_rc  # noqa: F401  (registers the :/arrows/ images)
 import pyautogui
 
 pyautogui.FAILSAFE = True
@@ -90,6 +92,18 @@ try:
 except Exception:
     _kb = None
 
+# Optional C diff backend; difflib is used when it is missing
+try:
+    from rapidfuzz.distance import Levenshtein as _rf_levenshtein
+except Exception:
+    _rf_levenshtein = None
+
+# Optional fast JSON encoder for settings persistence
+try:
+    import orjson as _orjson
+except Exception:
+    _orjson = None
+
 # ---------------------------------------------------------------------------
 # Paths & Icon
 # ---------------------------------------------------------------------------
@@ -144,37 +158,86 @@ _KEYBOARD_NEIGHBORS: dict[str, str] = {
 _COMMON_LETTERS = set("etaoinshrdlu")
 _MEDIUM_LETTERS = set("cmfwypvbg")
 _RARE_LETTERS = set("kjqxz")
+_SYMBOL_KEYS = set("@#$%&*_")
 
 
-def _nearby_key(ch: str) -> str:
-    """Return a random neighboring key on a QWERTY keyboard."""
+def _letter_complexity(ch: str) -> float:
+    """Per-character typing difficulty, before the word-length bump."""
     lower = ch.lower()
-    neighbors = _KEYBOARD_NEIGHBORS.get(lower, "")
-    if not neighbors:
-        # Fallback: pick a random letter
-        neighbors = "abcdefghijklmnopqrstuvwxyz"
-    picked = random.choice(neighbors)
-    return picked.upper() if ch.isupper() else picked
-
-
-def _iter_chars_with_word_len(text: str):
-    """Yield (char, word_len) pairs, preserving word length for each char."""
-    i = 0
-    n = len(text)
-    whitespace = {" ", "\n", "\t"}
-    while i < n:
-        ch = text[i]
-        if ch in whitespace:
-            yield ch, 0
-            i += 1
-            continue
-        j = i
-        while j < n and text[j] not in whitespace:
-            j += 1
-        word_len = j - i
-        for k in range(i, j):
-            yield text[k], word_len
-        i = j
+    factor = 1.0
+    if lower in _RARE_LETTERS:
+        factor += 0.25
+    elif lower in _MEDIUM_LETTERS:
+        factor += 0.12
+    elif lower in _COMMON_LETTERS:
+        factor -= 0.05
+    if ch.isdigit() or ch in _SYMBOL_KEYS:
+        factor += 0.15
+    return factor
+
+
+# Difficulty per ASCII ordinal, and the extra for long words (index = word
+# length, capped at 12).
+_BASE_COMPLEXITY = [_letter_complexity(chr(_o)) for _o in range(128)]
+_WORD_LEN_BUMP = [0.0] * 8 + [0.15] * 4 + [0.25]
+
+
+# Per-character class bits for ASCII; anything else is neither.
+_CH_SPACE = 1          # word separator: space, tab, newline
+_CH_SENTENCE_END = 2   # ends a sentence or paragraph
+_CHAR_CLASS = bytearray(128)
+for _c in " \t\n":
+    _CHAR_CLASS[ord(_c)] |= _CH_SPACE
+for _c in ".!?\n":
+    _CHAR_CLASS[ord(_c)] |= _CH_SENTENCE_END
+del _c
+
+
+def _char_class(ch: str) -> int:
+    return _CHAR_CLASS[ord(ch)] if ch < "\x80" else 0
+
+
+# Typo candidates per ASCII ordinal, with case already applied, so the typo
+# path is a single index; unmapped keys fall back to any letter.
+_FALLBACK_KEYS = "abcdefghijklmnopqrstuvwxyz"
+_NEIGHBOR_TABLE: list[str] = [_FALLBACK_KEYS] * 128
+for _k, _v in _KEYBOARD_NEIGHBORS.items():
+    _NEIGHBOR_TABLE[ord(_k)] = _v
+    _NEIGHBOR_TABLE[ord(_k.upper())] = _v.upper()
+for _c in "ABCDEFGHIJKLMNOPQRSTUVWXYZ":
+    if _c.lower() not in _KEYBOARD_NEIGHBORS:
+        _NEIGHBOR_TABLE[ord(_c)] = _FALLBACK_KEYS.upper()
+del _k, _v, _c
+
+
+def _nearby_key(ch: str, rand=random.random) -> str:
+    """Return a random neighboring key on a QWERTY keyboard."""
+    if ch < "\x80":
+        neighbors = _NEIGHBOR_TABLE[ord(ch)]
+    else:
+        neighbors = _FALLBACK_KEYS.upper() if ch.isupper() else _FALLBACK_KEYS
+    return neighbors[int(rand() * len(neighbors))]
+
+
+_WORD_RE = re.compile(r"[^ \t\n]+")
+
+
+def _word_ends(text: str) -> list[int]:
+    """For each index, the end of the word containing it (itself for whitespace)."""
+    ends = list(range(len(text)))
+    for m in _WORD_RE.finditer(text):
+        start, end = m.span()
+        ends[start:end] = [end] * (end - start)
+    return ends
+
+
+def _word_lens(text: str) -> list[int]:
+    """For each index, the length of the word containing it (0 for whitespace)."""
+    lens = [0] * len(text)
+    for m in _WORD_RE.finditer(text):
+        start, end = m.span()
+        lens[start:end] = [end - start] * (end - start)
+    return lens
 
 
 # ---------------------------------------------------------------------------
@@ -319,6 +382,151 @@ if _IS_WINDOWS:
             self._registered.clear()
 
 
+# ---------------------------------------------------------------------------
+# Windows direct keyboard input – one SendInput call per typed character
+# ---------------------------------------------------------------------------
+if _IS_WINDOWS:
+    _INPUT_KEYBOARD = 1
+    _KEYEVENTF_KEYUP = 0x0002
+    _KEYEVENTF_UNICODE = 0x0004
+    _VK_SHIFT = 0x10
+    _VK_SPECIAL = {"\n": 0x0D, "\t": 0x09}  # VK_RETURN, VK_TAB
+    _USER32.VkKeyScanW.restype = ctypes.c_short
+    _USER32.VkKeyScanW.argtypes = [ctypes.c_wchar]
+
+    class _KEYBDINPUT(ctypes.Structure):
+        _fields_ = [
+            ("wVk", wintypes.WORD),
+            ("wScan", wintypes.WORD),
+            ("dwFlags", wintypes.DWORD),
+            ("time", wintypes.DWORD),
+            ("dwExtraInfo", ctypes.c_size_t),
+        ]
+
+
+    class _MOUSEINPUT(ctypes.Structure):
+        _fields_ = [
+            ("dx", wintypes.LONG),
+            ("dy", wintypes.LONG),
+            ("mouseData", wintypes.DWORD),
+            ("dwFlags", wintypes.DWORD),
+            ("time", wintypes.DWORD),
+            ("dwExtraInfo", ctypes.c_size_t),
+        ]
+
+
+    class _INPUTUNION(ctypes.Union):
+        # MOUSEINPUT is the largest member; it sizes INPUT correctly.
+        _fields_ = [("ki", _KEYBDINPUT), ("mi", _MOUSEINPUT)]
+
+
+    class _INPUT(ctypes.Structure):
+        _fields_ = [("type", wintypes.DWORD), ("u", _INPUTUNION)]
+
+
+    _INPUT_SIZE = ctypes.sizeof(_INPUT)
+    _key_input_cache: dict[str, tuple[ctypes.Array, int]] = {}
+
+
+    def _key_event(vk: int = 0, scan: int = 0, flags: int = 0) -> _INPUT:
+        inp = _INPUT(type=_INPUT_KEYBOARD)
+        inp.u.ki = _KEYBDINPUT(wVk=vk, wScan=scan, dwFlags=flags)
+        return inp
+
+
+    def _build_key_inputs(ch: str) -> list[_INPUT]:
+        """Key events that type *ch*, using its virtual key where possible."""
+        vk = _VK_SPECIAL.get(ch)
+        shift = False
+        if vk is None and len(ch) == 1:
+            scan = _USER32.VkKeyScanW(ch)
+            # High byte is the shift state: 1 = Shift, 2 = Ctrl, 4 = Alt.
+            if scan != -1 and not (scan >> 8) & 0x06:
+                vk = scan & 0xFF
+                shift = bool((scan >> 8) & 0x01)
+        if vk is None:
+            # Characters without a plain key (AltGr, emoji, …) go as Unicode.
+            events: list[_INPUT] = []
+            units = ch.encode("utf-16-le")
+            for k in range(0, len(units), 2):
+                unit = int.from_bytes(units[k:k + 2], "little")
+                events.append(_key_event(scan=unit, flags=_KEYEVENTF_UNICODE))
+                events.append(
+                    _key_event(scan=unit, flags=_KEYEVENTF_UNICODE | _KEYEVENTF_KEYUP)
+                )
+            return events
+        events = [_key_event(vk=vk), _key_event(vk=vk, flags=_KEYEVENTF_KEYUP)]
+        if shift:
+            events.insert(0, _key_event(vk=_VK_SHIFT))
+            events.append(_key_event(vk=_VK_SHIFT, flags=_KEYEVENTF_KEYUP))
+        return events
+
+
+    def _cached_inputs(ch: str) -> tuple[ctypes.Array, int]:
+        cached = _key_input_cache.get(ch)
+        if cached is None:
+            events = _build_key_inputs(ch)
+            cached = ((_INPUT * len(events))(*events), len(events))
+            _key_input_cache[ch] = cached
+        return cached
+
+    _SHIFT_UP = (_INPUT * 1)(_key_event(vk=_VK_SHIFT, flags=_KEYEVENTF_KEYUP))
+
+    def _finish_inputs(arr: ctypes.Array, sent: int, n: int):
+        """Resume a cut-off SendInput at event *sent* of *n*; if that falls
+        short too, release Shift so it is never left held down."""
+        if sent < n:
+            sent += _USER32.SendInput(
+                n - sent, ctypes.byref(arr, sent * _INPUT_SIZE), _INPUT_SIZE
+            )
+        if sent < n:
+            _USER32.SendInput(1, _SHIFT_UP, _INPUT_SIZE)
+
+    def _send_char(ch: str) -> bool:
+        """Type *ch* with a single SendInput call. Returns False when no
+        event got through, so the caller can fall back."""
+        arr, n = _cached_inputs(ch)
+        sent = _USER32.SendInput(n, arr, _INPUT_SIZE)
+        if sent == 0:
+            return False
+        _finish_inputs(arr, sent, n)
+        return True
+
+    def _send_text(text: str) -> int:
+        """Type *text* with a single SendInput call. Returns how many of its
+        characters were typed; a character cut off midway is completed."""
+        parts = [_cached_inputs(ch) for ch in text]
+        total = sum(n for _, n in parts)
+        batch = (_INPUT * total)()
+        offset = 0
+        for arr, n in parts:
+            ctypes.memmove(ctypes.byref(batch, offset), arr, n * _INPUT_SIZE)
+            offset += n * _INPUT_SIZE
+        sent = _USER32.SendInput(total, batch, _INPUT_SIZE)
+        if sent == total:
+            return len(text)
+        end = 0
+        for i, (_, n) in enumerate(parts):
+            start, end = end, end + n
+            if sent < end:
+                if sent == start:
+                    return i
+                _finish_inputs(batch, sent, end)
+                return i + 1
+        return len(text)
+
+
+# ---------------------------------------------------------------------------
+# Windows scheduling – 1 ms timer resolution and a raised worker priority
+# ---------------------------------------------------------------------------
+if _IS_WINDOWS:
+    _WINMM = ctypes.windll.winmm
+    _KERNEL32 = ctypes.windll.kernel32
+    _KERNEL32.GetCurrentThread.restype = wintypes.HANDLE
+    _KERNEL32.SetThreadPriority.argtypes = [wintypes.HANDLE, ctypes.c_int]
+    _THREAD_PRIORITY_HIGHEST = 2
+
+
 # ---------------------------------------------------------------------------
 # Settings persistence – saves EVERYTHING
 # ---------------------------------------------------------------------------
@@ -329,17 +537,51 @@ def _load_settings() -> dict:
         return {}
 
 
-def _save_settings(data: dict):
+# Last bytes written to _SETTINGS_FILE, so unchanged saves skip the disk
+_last_settings_blob: bytes | None = None
+_last_settings_generation = -1
+_SAVE_LOCK = threading.Lock()  # Saves can come from the thread pool
+
+
+def _dump_settings(data: dict) -> bytes:
+    if _orjson is not None:
+        try:
+            return _orjson.dumps(data, option=_orjson.OPT_INDENT_2)
+        except TypeError:
+            pass
+    return json.dumps(data, indent=2).encode("utf-8")
+
+
+def _save_settings(data: dict, generation: int | None = None) -> bool:
+    """Write settings if they changed. False only when the write failed.
+
+    Snapshots tagged with a *generation* older than the last one written
+    are dropped, so an out-of-order save never restores stale settings.
+    """
+    global _last_settings_blob, _last_settings_generation
     try:
-        _SETTINGS_FILE.write_text(json.dumps(data, indent=2), "utf-8")
+        blob = _dump_settings(data)
+        with _SAVE_LOCK:
+            if generation is not None:
+                if generation < _last_settings_generation:
+                    return True
+                _last_settings_generation = generation
+            if blob == _last_settings_blob:
+                return True
+            # Write a sibling file and swap it in so a crash never truncates settings
+            tmp = _SETTINGS_FILE.with_name(_SETTINGS_FILE.name + ".tmp")
+            tmp.write_bytes(blob)
+            os.replace(tmp, _SETTINGS_FILE)
+            _last_settings_blob = blob
+        return True
     except Exception:
-        pass
+        return False
 
 
 # ---------------------------------------------------------------------------
 # Diff helpers – word-level diff between original and replacement text
 # ---------------------------------------------------------------------------
-@dataclass
+@dataclass(slots=True)
 class DiffOp:
     """A single diff operation."""
     kind: str  # "equal", "insert", "delete", "replace"
@@ -347,16 +589,26 @@ class DiffOp:
     new_text: str = ""
 
 
+_TOKEN_RE = re.compile(r'\S+|\s+')
+
+
 def _word_tokenize(text: str) -> list[str]:
-    return re.findall(r'\S+|\s+', text)
+    return _TOKEN_RE.findall(text)
 
 
 def _compute_diff(original: str, replacement: str) -> list[DiffOp]:
     old_tokens = _word_tokenize(original)
     new_tokens = _word_tokenize(replacement)
-    sm = difflib.SequenceMatcher(None, old_tokens, new_tokens)
+    if _rf_levenshtein is not None:
+        opcodes = _rf_levenshtein.opcodes(old_tokens, new_tokens)
+    else:
+        # autojunk would discard the very common whitespace tokens on
+        # longer texts and fall back to coarse replace blocks
+        opcodes = difflib.SequenceMatcher(
+            None, old_tokens, new_tokens, autojunk=False
+        ).get_opcodes()
     ops: list[DiffOp] = []
-    for tag, i1, i2, j1, j2 in sm.get_opcodes():
+    for tag, i1, i2, j1, j2 in opcodes:
         old_chunk = "".join(old_tokens[i1:i2])
         new_chunk = "".join(new_tokens[j1:j2])
         if tag == "equal":
@@ -370,25 +622,38 @@ def _compute_diff(original: str, replacement: str) -> list[DiffOp]:
     return ops
 
 
-def _map_old_index_to_new_index(old_text: str, new_text: str, old_index: int) -> int:
-    """Map an index in old_text to an approximate index in new_text."""
-    if old_index <= 0:
-        return 0
-    if old_index >= len(old_text):
-        return len(new_text)
-    sm = difflib.SequenceMatcher(None, list(old_text), list(new_text))
-    for tag, i1, i2, j1, j2 in sm.get_opcodes():
-        if i1 <= old_index < i2:
-            if tag == "equal":
-                return j1 + (old_index - i1)
-            if tag == "replace":
-                span_old = max(1, i2 - i1)
-                span_new = max(0, j2 - j1)
-                ratio = (old_index - i1) / span_old
-                return j1 + int(round(ratio * span_new))
-            if tag == "delete":
-                return j1
-    return len(new_text)
+# Translucent run backgrounds (#AARRGGBB) for the diff preview
+_DEL_BG = f"#44{RED[1:]}"
+_INS_BG = f"#44{GREEN[1:]}"
+
+
+def _map_replace_offset(op: DiffOp, offset: int) -> int:
+    """Map an offset into a replace op's old_text to the proportional
+    offset into its new_text."""
+    ratio = min(1.0, offset / max(1, len(op.old_text)))
+    return int(round(ratio * len(op.new_text)))
+
+
+@functools.lru_cache(maxsize=1)
+def _diff_formats() -> dict[str, QTextCharFormat]:
+    """Char formats for the diff preview, keyed by op kind (built once)."""
+    font = QFont()
+    font.setFamilies(["Cascadia Code", "Consolas", "monospace"])
+    font.setPixelSize(11)
+
+    def fmt(background: str, color: str, strike: bool = False) -> QTextCharFormat:
+        f = QTextCharFormat()
+        f.setFont(font)
+        f.setBackground(QColor(background))
+        f.setForeground(QColor(color))
+        f.setFontStrikeOut(strike)
+        return f
+
+    return {
+        "equal": fmt(SURFACE0, TEXT),
+        "delete": fmt(_DEL_BG, RED, strike=True),
+        "insert": fmt(_INS_BG, GREEN),
+    }
 
 
 # ---------------------------------------------------------------------------
@@ -411,14 +676,92 @@ class WorkerSignals(QObject):
     char_typed = Signal(str)
     status = Signal(str)
     finished = Signal()
-    log = Signal(str)
+    log_batch = Signal(list)       # Log lines, sent a few at a time
     cursor_pos = Signal(int)       # Current character position in text
     pause_info = Signal(int, str)  # Position + surrounding context snippet
 
 
+# ---------------------------------------------------------------------------
+# Diff preview task (runs on the Qt thread pool)
+# ---------------------------------------------------------------------------
+class DiffSignals(QObject):
+    ready = Signal(int, object)  # Request id + list[DiffOp]
+
+
+class DiffTask(QRunnable):
+    """Computes the diff preview's ops off the UI thread."""
+
+    def __init__(self, request_id: int, original: str, replacement: str,
+                 signals: DiffSignals):
+        super().__init__()
+        self._request_id = request_id
+        self._original = original
+        self._replacement = replacement
+        self._signals = signals
+
+    def run(self):
+        self._signals.ready.emit(
+            self._request_id, _compute_diff(self._original, self._replacement)
+        )
+
+
+# ---------------------------------------------------------------------------
+# Settings save task (runs on the window's save pool)
+# ---------------------------------------------------------------------------
+class SaveSignals(QObject):
+    failed = Signal()
+
+
+class SaveTask(QRunnable):
+    """Serializes and writes a settings snapshot off the UI thread."""
+
+    def __init__(self, data: dict, generation: int, signals: SaveSignals):
+        super().__init__()
+        self._data = data
+        self._generation = generation
+        self._signals = signals
+
+    def run(self):
+        if not _save_settings(self._data, self._generation):
+            self._signals.failed.emit()
+
+
 # ---------------------------------------------------------------------------
 # Typing worker (runs in background thread)
 # ---------------------------------------------------------------------------
+# Max characters of unchanged text skipped per key call in replace mode
+_EQUAL_CHUNK = 16
+
+# Max backspaces sent per key call when correcting a typo
+_BACKSPACE_CHUNK = 8
+
+# Max characters shift-selected per key call before deleting or replacing
+_SELECT_CHUNK = 8
+
+# Max characters sent per key call when bot mode types new text
+_BOT_CHUNK = 64
+
+# Minimum spacing between cursor/progress signals sent to the GUI; 30 Hz is
+# as fast as the overlay and progress bar can usefully repaint.
+_EMIT_INTERVAL = 1 / 30
+
+# Tail of each delay that _sleep spins through instead of waiting, since
+# Windows timed waits land on the 1 ms timer tick at best.
+_SPIN_WINDOW = 0.0015 if _IS_WINDOWS else 0.0
+
+# Worker log lines go to the GUI once this many are queued or the
+# last flush is this old, so busy diffs don't reflow the log per op.
+_LOG_BATCH_MAX = 32
+_LOG_BATCH_INTERVAL = 0.25
+
+# Keeps snippets of typed text on one log line
+_LOG_TRUNC_TABLE = str.maketrans({"\n": "\\n", "\t": "\\t", "\r": "\\r"})
+
+
+def _log_trunc(text: str, n: int = 30) -> str:
+    return text[:n].translate(_LOG_TRUNC_TABLE)
+
+
 class TypingWorker:
     def __init__(self, text: str, options: TypingOptions, mode: str,
                  diff_ops: list[DiffOp] | None = None, start_pos: int = 0):
@@ -426,6 +769,14 @@ class TypingWorker:
         self.options = options
         self.mode = mode
         self.diff_ops = diff_ops or []
+        # Prefix sums of original-text length and work over diff_ops, so jumps
+        # can bisect to their op instead of rescanning from the start
+        self._cum_old = [0]
+        self._cum_work = [0]
+        for op in self.diff_ops:
+            old_len = len(op.old_text) if op.kind in ("equal", "delete", "replace") else 0
+            self._cum_old.append(self._cum_old[-1] + old_len)
+            self._cum_work.append(self._cum_work[-1] + self._op_work(op))
         self.signals = WorkerSignals()
         self._is_bot = (self.options.type_mode or "").lower() == "bot"
         self._stopped = False
@@ -441,6 +792,24 @@ class TypingWorker:
         self._jump_to: int | None = None
         self._words_since_pause = 0
         self._thread: threading.Thread | None = None
+        # Set by every control call so sleeps and pauses wake immediately.
+        # The reason lives in the flags above, which waiters re-read after
+        # each wake, so one Event covers stop, pause, skip and jump alike.
+        self._wake = threading.Event()
+        # Per-worker generator; _rand is bound once for the hot typing paths
+        self._rnd = random.Random()
+        self._rand = self._rnd.random
+        # (base delay, variability floor, variability span), set on first use
+        self._delay_params: tuple[float, float, float] | None = None
+        # Throttled cursor/progress reporting (see _report)
+        self._last_emit = 0.0
+        self._emit_pending = False
+        self._pending_percent = 0
+        self._emitted_percent = -1
+        self._emitted_pos = -1
+        # Log lines waiting to go out as one log_batch emit (see _log)
+        self._log_buffer: list[str] = []
+        self._last_log_flush = 0.0
 
     # -- control --
     def start(self):
@@ -449,27 +818,45 @@ class TypingWorker:
 
     def stop(self):
         self._stopped = True
+        self._wake.set()
 
     def pause(self):
         self._paused = not self._paused
         if self._paused:
             self._pause_notified = False
+        self._wake.set()
 
     def skip(self):
         self._skip = True
+        self._wake.set()
 
     def request_jump(self, pos: int):
         self._jump_to = max(0, pos)
+        self._wake.set()
 
     # -- interruptible sleep --
-    def _sleep(self, seconds: float):
-        end = time.monotonic() + seconds
-        while time.monotonic() < end:
+    def _sleep(self, seconds: float) -> bool:
+        """Wait *seconds*, blocking through pauses. False if stopped meanwhile."""
+        # Don't leave the GUI behind on a throttled update across a long wait
+        if seconds >= _EMIT_INTERVAL and (self._emit_pending or self._log_buffer):
+            self._flush_pending()
+        end = time.perf_counter() + seconds
+        while True:
+            # Clear before checking state so a control call is never missed
+            self._wake.clear()
             if self._stopped:
-                return
+                return False
             if self._paused:
                 self._handle_pause(self._cursor_pos)
-            time.sleep(min(0.05, max(0, end - time.monotonic())))
+                continue
+            remaining = end - time.perf_counter()
+            if remaining <= 0:
+                return True
+            if remaining > _SPIN_WINDOW:
+                self._wake.wait(remaining - _SPIN_WINDOW)
+            else:
+                # Timed waits can overshoot by a tick; finish by yielding
+                time.sleep(0)
 
     def _consume_jump(self) -> int | None:
         if self._jump_to is None:
@@ -482,21 +869,9 @@ class TypingWorker:
     def _char_complexity(self, ch: str | None, word_len: int | None) -> float:
         if not ch:
             return 1.0
-        lower = ch.lower()
-        factor = 1.0
-        if lower in _RARE_LETTERS:
-            factor += 0.25
-        elif lower in _MEDIUM_LETTERS:
-            factor += 0.12
-        elif lower in _COMMON_LETTERS:
-            factor -= 0.05
-        if ch.isdigit() or ch in {"@", "#", "$", "%", "&", "*", "_"}:
-            factor += 0.15
+        factor = _BASE_COMPLEXITY[ord(ch)] if ch < "\x80" else _letter_complexity(ch)
         if word_len:
-            if word_len >= 12:
-                factor += 0.25
-            elif word_len >= 8:
-                factor += 0.15
+            factor += _WORD_LEN_BUMP[min(word_len, 12)]
         return max(0.5, min(1.8, factor))
 
     def _update_tempo(self, base_delay: float, complexity: float) -> float:
@@ -513,7 +888,7 @@ class TypingWorker:
                 self._short_bias = max(0, self._short_bias - 1)
                 self._long_bias = max(0, self._long_bias - 1)
 
-        drift = random.uniform(-0.04, 0.04)
+        drift = 0.08 * self._rand() - 0.04
         drift += 0.03 * self._short_bias
         drift -= 0.03 * self._long_bias
         self._tempo = max(0.5, min(1.5, self._tempo + drift))
@@ -522,9 +897,11 @@ class TypingWorker:
     def _char_delay(self, ch: str | None = None, word_len: int | None = None) -> float:
         if self._is_bot:
             return 0.0
-        base = 60.0 / (self.options.wpm * 5.0)
-        v = self.options.variability
-        base_var = base * random.uniform(1.0 - v, 1.0 + v)
+        if self._delay_params is None:
+            v = self.options.variability
+            self._delay_params = (60.0 / (self.options.wpm * 5.0), 1.0 - v, 2.0 * v)
+        base, var_lo, var_span = self._delay_params
+        base_var = base * (var_lo + var_span * self._rand())
         complexity = self._char_complexity(ch, word_len)
         mult = self._update_tempo(base_var, complexity)
         delay = base_var * mult
@@ -550,6 +927,10 @@ class TypingWorker:
             self._handle_pause(self._cursor_pos)
             if self._stopped:
                 return
+        if _IS_WINDOWS:
+            pyautogui.failSafeCheck()
+            if _send_char(ch):
+                return
         if ch == '"':
             pyautogui.keyDown("shift")
             pyautogui.press("'")
@@ -566,9 +947,47 @@ class TypingWorker:
             except Exception:
                 pyautogui.press(ch)
 
+    def _type_text(self, text: str):
+        """Type a run of characters with no delays between them."""
+        if _IS_WINDOWS:
+            pyautogui.failSafeCheck()
+            # Only what SendInput did not insert is typed again.
+            text = text[_send_text(text):]
+        for ch in text:
+            self._type_char(ch)
+
+    def _type_batched(self, text: str, pos: int, done: int, total_work: int) -> tuple[int, bool]:
+        """Bot-mode typing of *text*, one key call per chunk.
+        Returns (updated done, True if a jump interrupted it)."""
+        typed = 0
+        while typed < len(text):
+            if self._stopped:
+                break
+            if self._jump_to is not None:
+                return done, True
+            if self._paused:
+                self._handle_pause(pos)
+                if self._stopped:
+                    break
+            chunk = text[typed:typed + _BOT_CHUNK]
+            self._type_text(chunk)
+            typed += len(chunk)
+            done += len(chunk)
+            self._report(pos, int(done / total_work * 100))
+        return done, False
+
     def _is_sentence_end(self, ch: str) -> bool:
         """True for characters that end a sentence or paragraph."""
-        return ch in {".", "!", "?", "\n"}
+        return bool(_char_class(ch) & _CH_SENTENCE_END)
+
+    def _idle_pause(self, duration: float) -> bool:
+        """One uninterrupted wait shown as "Thinking…"; False if stopped.
+        Tempo bias is left alone so WPM stays unaffected."""
+        self.signals.status.emit("Thinking…")
+        if not self._sleep(duration):
+            return False
+        self.signals.status.emit("Typing…")
+        return True
 
     def _thinking_pause(self, ch: str):
         """Insert a 'thinking pause' at sentence/paragraph boundaries.
@@ -577,21 +996,10 @@ class TypingWorker:
             return
         if not self._is_sentence_end(ch):
             return
-        duration = random.uniform(0.5, 5.0)
+        duration = 0.5 + 4.5 * self._rand()
         label = "end of paragraph" if ch == "\n" else f"'{ch}'"
-        self.signals.log.emit(f"Thinking pause ({duration:.1f}s) at {label}")
-        self.signals.status.emit("Thinking…")
-        # Sleep without updating tempo bias so WPM stays unaffected
-        saved_last = self._last_delay
-        end = time.monotonic() + duration
-        while time.monotonic() < end:
-            if self._stopped:
-                return
-            if self._paused:
-                self._handle_pause(self._cursor_pos)
-            time.sleep(min(0.05, max(0, end - time.monotonic())))
-        self._last_delay = saved_last
-        self.signals.status.emit("Typing…")
+        self._log(f"Thinking pause ({duration:.1f}s) at {label}")
+        self._idle_pause(duration)
 
     def _maybe_word_pause(self):
         """Chance-based pauses between words (not counted towards WPM)."""
@@ -599,31 +1007,62 @@ class TypingWorker:
             return
         self._words_since_pause += 1
         chance = min(0.9, 0.07 + self._words_since_pause * 0.05)
-        if random.random() > chance:
+        if self._rand() > chance:
             return
-        base = random.uniform(0.4, 1.1)
+        base = 0.4 + 0.7 * self._rand()
         scale = max(1, self._words_since_pause)
-        duration = base * (1 + 0.35 * scale) + random.uniform(-0.2, 0.6)
+        duration = base * (1 + 0.35 * scale) + (0.8 * self._rand() - 0.2)
         duration = max(0.5, min(6.0, duration))
-        self.signals.log.emit(
+        self._log(
             f"Word pause ({duration:.1f}s) after {self._words_since_pause} words"
         )
-        self.signals.status.emit("Thinking…")
-        saved_last = self._last_delay
-        end = time.monotonic() + duration
-        while time.monotonic() < end:
-            if self._stopped:
-                return
-            if self._paused:
-                self._handle_pause(self._cursor_pos)
-            time.sleep(min(0.05, max(0, end - time.monotonic())))
-        self._last_delay = saved_last
-        self.signals.status.emit("Typing…")
-        self._words_since_pause = 0
-
-    def _emit_cursor(self, pos: int):
+        if self._idle_pause(duration):
+            self._words_since_pause = 0
+
+    def _log(self, msg: str):
+        """Queue a log line; lines go out in batches by count or age."""
+        self._log_buffer.append(msg)
+        now = time.perf_counter()
+        if (len(self._log_buffer) >= _LOG_BATCH_MAX
+                or now - self._last_log_flush >= _LOG_BATCH_INTERVAL):
+            self._flush_log(now)
+
+    def _flush_log(self, now: float | None = None):
+        self._last_log_flush = time.perf_counter() if now is None else now
+        if self._log_buffer:
+            lines, self._log_buffer = self._log_buffer, []
+            self.signals.log_batch.emit(lines)
+
+    def _flush_pending(self):
+        """Send any held-back cursor/progress update and log lines now."""
+        if self._emit_pending:
+            self._flush_report()
+        if self._log_buffer:
+            self._flush_log()
+
+    def _emit_progress(self, percent: int):
+        if percent != self._emitted_percent:
+            self._emitted_percent = percent
+            self.signals.progress.emit(percent)
+
+    def _report(self, pos: int, percent: int, force: bool = False):
+        """Track cursor/progress; emit at most once per _EMIT_INTERVAL unless forced."""
         self._cursor_pos = pos
-        self.signals.cursor_pos.emit(pos)
+        self._pending_percent = percent
+        now = time.perf_counter()
+        if not force and now - self._last_emit < _EMIT_INTERVAL:
+            self._emit_pending = True
+            return
+        self._flush_report(now)
+
+    def _flush_report(self, now: float | None = None):
+        """Emit the latest tracked cursor/progress right away."""
+        self._emit_pending = False
+        self._last_emit = time.perf_counter() if now is None else now
+        if self._cursor_pos != self._emitted_pos:
+            self._emitted_pos = self._cursor_pos
+            self.signals.cursor_pos.emit(self._cursor_pos)
+        self._emit_progress(self._pending_percent)
 
     def _get_context_snippet(self, pos: int) -> str:
         """Get a ±20 char snippet around the cursor for logging."""
@@ -635,17 +1074,27 @@ class TypingWorker:
         return f"…{before}▌{after}…"
 
     def _handle_pause(self, pos: int):
-        """Block while paused, emit position info."""
+        """Block on the wake Event while paused, emit position info."""
+        if self._paused and (self._emit_pending or self._log_buffer):
+            self._flush_pending()
         if self._paused and not self._pause_notified:
             snippet = self._get_context_snippet(pos)
             self.signals.pause_info.emit(pos, snippet)
             self.signals.status.emit("Paused")
             self._pause_notified = True
-        while self._paused and not self._stopped:
-            time.sleep(0.05)
+        while True:
+            self._wake.clear()
+            if not self._paused or self._stopped:
+                return
+            self._wake.wait()
 
     # -- main run loop --
     def _run(self):
+        if _IS_WINDOWS:
+            # The default 15.6 ms timer tick would round short key delays up,
+            # and GUI repaints shouldn't delay the next keystroke.
+            _WINMM.timeBeginPeriod(1)
+            _KERNEL32.SetThreadPriority(_KERNEL32.GetCurrentThread(), _THREAD_PRIORITY_HIGHEST)
         try:
             for i in range(self.options.start_delay, 0, -1):
                 if self._stopped:
@@ -661,11 +1110,14 @@ class TypingWorker:
                 self._run_fresh()
 
             self.signals.status.emit("Done" if not self._stopped else "Stopped")
-            self.signals.log.emit("Typing finished." if not self._stopped else "Typing stopped.")
+            self._log("Typing finished." if not self._stopped else "Typing stopped.")
         except Exception as exc:
             self.signals.status.emit(f"Error: {exc}")
-            self.signals.log.emit(f"Error: {exc}")
+            self._log(f"Error: {exc}")
         finally:
+            if _IS_WINDOWS:
+                _WINMM.timeEndPeriod(1)
+            self._flush_pending()
             self.signals.finished.emit()
 
     # -------------------------------------------------------------------
@@ -677,12 +1129,11 @@ class TypingWorker:
         idx = min(self._start_pos, total)
         done = idx
         if total:
-            self._emit_cursor(idx)
-            self.signals.progress.emit(int(done / total * 100))
+            self._report(idx, int(done / total * 100), force=True)
 
-        whitespace = {" ", "\n", "\t"}
-        current_word_len = 0
-        remaining_in_word = 0
+        word_ends = _word_ends(text)
+        word_lens = _word_lens(text)
+        rand = self._rand
         prev_was_word = False
 
         while idx < total:
@@ -699,8 +1150,7 @@ class TypingWorker:
                             break
                     self._type_char(rc)
                     done += 1
-                self._emit_cursor(total)
-                self.signals.progress.emit(100)
+                self._report(total, 100, force=True)
                 break
 
             jump = self._consume_jump()
@@ -709,8 +1159,7 @@ class TypingWorker:
                 done = idx
                 prev_was_word = False
                 self._words_since_pause = 0
-                self._emit_cursor(idx)
-                self.signals.progress.emit(int(done / total * 100) if total else 100)
+                self._report(idx, int(done / total * 100) if total else 100, force=True)
                 continue
 
             self._handle_pause(idx)
@@ -719,34 +1168,21 @@ class TypingWorker:
             self.signals.status.emit("Typing…")
 
             ch = text[idx]
-            if ch in whitespace:
-                current_word_len = 0
-                remaining_in_word = 0
-                word_len = 0
-            else:
-                if idx == 0 or text[idx - 1] in whitespace or remaining_in_word <= 0:
-                    word_end = idx
-                    while word_end < total and text[word_end] not in whitespace:
-                        word_end += 1
-                    current_word_len = word_end - idx
-                    remaining_in_word = current_word_len
-                word_len = current_word_len
-                remaining_in_word = max(0, remaining_in_word - 1)
+            word_len = word_lens[idx]
+            is_space = not word_len  # 0 only for whitespace
 
             # --- Typo simulation (realistic) ---
             if (not self._is_bot and self.options.typo_rate > 0
                     and ch.isalpha()
-                    and random.random() < self.options.typo_rate / 100):
+                    and rand() < self.options.typo_rate / 100):
                 # Find the end of the current word
-                word_end = idx
-                while word_end < total and text[word_end] not in whitespace:
-                    word_end += 1
+                word_end = word_ends[idx]
                 word_len = word_end - idx
 
                 # Type the wrong letter now
-                wrong = _nearby_key(ch)
+                wrong = _nearby_key(ch, rand)
                 self._type_char(wrong)
-                self.signals.log.emit(f"Typo at pos {idx}: '{ch}' → '{wrong}'")
+                self._log(f"Typo at pos {idx}: '{ch}' → '{wrong}'")
 
                 # Continue typing the rest of the word normally
                 chars_after_typo = 0
@@ -761,21 +1197,25 @@ class TypingWorker:
                     break
 
                 # Pause to "notice" the mistake (~1 second)
-                self._sleep(self._scaled_delay(random.uniform(0.5, 2.0)))
+                self._sleep(self._scaled_delay(0.5 + 1.5 * rand()))
 
-                # Backspace from the end of the word to the typo position
+                # Backspace from the end of the word to the typo position, a
+                # few keys per call with their delays slept after each batch
                 backspaces_needed = chars_after_typo + 1  # +1 for the wrong char
-                for _ in range(backspaces_needed):
-                    if self._stopped:
-                        break
-                    pyautogui.press("backspace")
-                    self._sleep(self._scaled_delay(random.uniform(0.04, 0.2)))
+                while backspaces_needed > 0 and not self._stopped:
+                    n = min(backspaces_needed, _BACKSPACE_CHUNK)
+                    backspaces_needed -= n
+                    pyautogui.press("backspace", presses=n, interval=0)
+                    delay = 0.0
+                    for _ in range(n):
+                        delay += self._scaled_delay(0.04 + 0.16 * rand())
+                    self._sleep(delay)
 
                 if self._stopped:
                     break
 
                 # Pause to "find" the correct letter (~1 second)
-                self._sleep(self._scaled_delay(random.uniform(0.5, 2.0)))
+                self._sleep(self._scaled_delay(0.5 + 1.5 * rand()))
 
                 # Now retype from the typo position to word end correctly
                 for j in range(idx, word_end):
@@ -783,9 +1223,10 @@ class TypingWorker:
                         break
                     self._type_char(text[j])
                     done += 1
-                    self._emit_cursor(j + 1)
-                    self.signals.progress.emit(int(done / total * 100))
+                    self._cursor_pos = j + 1
                     self._sleep(self._char_delay(text[j], word_len))
+                # One update for the corrected word rather than per letter
+                self._report(self._cursor_pos, int(done / total * 100))
 
                 idx = word_end
                 continue
@@ -794,9 +1235,8 @@ class TypingWorker:
             self._type_char(ch)
             done += 1
             idx += 1
-            self._emit_cursor(idx)
+            self._report(idx, int(done / total * 100) if total else 100)
             self.signals.char_typed.emit(ch)
-            self.signals.progress.emit(int(done / total * 100) if total else 100)
 
             delay = self._char_delay(ch, word_len)
             self._sleep(delay)
@@ -805,10 +1245,10 @@ class TypingWorker:
             self._thinking_pause(ch)
 
             # Word pause after word boundaries (space/tab/newline)
-            if ch in {" ", "\t", "\n"} and prev_was_word:
+            if is_space and prev_was_word:
                 self._maybe_word_pause()
 
-            prev_was_word = ch not in whitespace
+            prev_was_word = not is_space
 
     def _op_work(self, op: DiffOp) -> int:
         if op.kind == "equal":
@@ -821,62 +1261,73 @@ class TypingWorker:
             return len(op.old_text) + len(op.new_text)
         return 0
 
-    def _trim_ops_for_start(self, start_pos: int) -> tuple[list[DiffOp], int]:
-        """Trim diff ops so processing starts from start_pos in original text.
-        Returns (trimmed_ops, skipped_work)."""
-        if start_pos <= 0:
-            return list(self.diff_ops), 0
-        trimmed: list[DiffOp] = []
-        skipped_work = 0
-        cursor = 0
-        ops = self.diff_ops
-        i = 0
-        while i < len(ops):
-            op = ops[i]
-            old_len = len(op.old_text) if op.kind in ("equal", "delete", "replace") else 0
-
-            if cursor + old_len <= start_pos:
-                skipped_work += self._op_work(op)
-                cursor += old_len
-                i += 1
-                continue
-
-            if start_pos <= cursor:
-                trimmed.extend(ops[i:])
+    def _select_forward(self, n: int, pos: int) -> bool:
+        """Shift-select the next n characters, a few keys per Shift press.
+        Returns True when a jump request interrupted the selection."""
+        scaled_delay = self._scaled_delay
+        left = n
+        while left > 0:
+            if self._stopped:
                 break
+            if self._jump_to is not None:
+                return True
+            if self._paused:
+                self._handle_pause(pos)
+                if self._stopped:
+                    break
+            k = min(left, _SELECT_CHUNK)
+            left -= k
+            # Shift is released again before sleeping so a pause never
+            # leaves it held down
+            pyautogui.keyDown("shift")
+            try:
+                pyautogui.press("right", presses=k, interval=0)
+            finally:
+                pyautogui.keyUp("shift")
+            delay = 0.0
+            for _ in range(k):
+                delay += scaled_delay(0.04)
+            self._sleep(delay)
+        return False
 
-            offset = start_pos - cursor
-            if op.kind == "equal":
-                skipped_work += offset
-                trimmed.append(
-                    DiffOp(kind="equal", old_text=op.old_text[offset:], new_text=op.new_text[offset:])
-                )
-            elif op.kind == "delete":
-                skipped_work += offset
-                trimmed.append(DiffOp(kind="delete", old_text=op.old_text[offset:]))
-            elif op.kind == "replace":
-                new_offset = _map_old_index_to_new_index(op.old_text, op.new_text, offset)
-                skipped_work += offset + new_offset
-                trimmed.append(
-                    DiffOp(kind="replace", old_text=op.old_text[offset:], new_text=op.new_text[new_offset:])
-                )
-            elif op.kind == "insert":
-                skipped_work += len(op.new_text)
-            trimmed.extend(ops[i + 1:])
-            break
-
-        return trimmed, skipped_work
+    def _trim_ops_for_start(self, start_pos: int) -> tuple[int, DiffOp | None, int]:
+        """Locate where processing starts from start_pos in original text.
+        Returns (start_index, head_op, skipped_work); head_op replaces
+        diff_ops[start_index] when the start falls inside that op."""
+        if start_pos <= 0:
+            return 0, None, 0
+        ops = self.diff_ops
+        # First op whose original span extends past start_pos
+        i = bisect.bisect_right(self._cum_old, start_pos) - 1
+        if i >= len(ops):
+            return len(ops), None, self._cum_work[-1]
+        cursor = self._cum_old[i]
+        skipped_work = self._cum_work[i]
+        if start_pos <= cursor:
+            return i, None, skipped_work
+
+        op = ops[i]
+        head: DiffOp | None = None
+        offset = start_pos - cursor
+        if op.kind == "equal":
+            skipped_work += offset
+            head = DiffOp(kind="equal", old_text=op.old_text[offset:], new_text=op.new_text[offset:])
+        elif op.kind == "delete":
+            skipped_work += offset
+            head = DiffOp(kind="delete", old_text=op.old_text[offset:])
+        elif op.kind == "replace":
+            new_offset = _map_replace_offset(op, offset)
+            skipped_work += offset + new_offset
+            head = DiffOp(kind="replace", old_text=op.old_text[offset:], new_text=op.new_text[new_offset:])
+        return i, head, skipped_work
 
     # -------------------------------------------------------------------
     # REPLACE TYPE – diff-based editing with position tracking
     # -------------------------------------------------------------------
     def _run_replace(self):
-        total_work = sum(self._op_work(op) for op in self.diff_ops) or 1
-        total_old_len = sum(
-            len(op.old_text) for op in self.diff_ops if op.kind in ("equal", "delete", "replace")
-        )
+        total_work = self._cum_work[-1] or 1
+        total_old_len = self._cum_old[-1]
         start_pos = min(self._start_pos, total_old_len)
-        whitespace = {" ", "\n", "\t"}
         prev_was_word = False
 
         while True:
@@ -886,33 +1337,35 @@ class TypingWorker:
                 prev_was_word = False
                 self._words_since_pause = 0
 
-            ops, skipped_work = self._trim_ops_for_start(start_pos)
+            start_index, head_op, skipped_work = self._trim_ops_for_start(start_pos)
+            ops = self.diff_ops
+            n_ops = len(ops)
             done = skipped_work
             cursor_in_original = start_pos
-            self._emit_cursor(cursor_in_original)
-            self.signals.progress.emit(int(done / total_work * 100))
+            self._report(cursor_in_original, int(done / total_work * 100), force=True)
 
             last_change_idx = -1
-            for i, op in enumerate(ops):
+            for i in range(n_ops - 1, start_index - 1, -1):
+                op = head_op if i == start_index and head_op is not None else ops[i]
                 if op.kind != "equal" and (op.old_text or op.new_text):
                     last_change_idx = i
+                    break
 
             if last_change_idx == -1:
-                self.signals.progress.emit(100)
-                self.signals.log.emit("No changes detected. Ending early.")
+                self._emit_progress(100)
+                self._log("No changes detected. Ending early.")
                 return
             is_bot = self._is_bot
-            use_select = not is_bot
 
             restart = False
-            for i, op in enumerate(ops):
+            for i in range(start_index, n_ops):
+                op = head_op if i == start_index and head_op is not None else ops[i]
                 if self._stopped:
                     break
 
                 if self._skip:
                     self._skip = False
-                    self.signals.progress.emit(100)
-                    self._emit_cursor(len(self.text))
+                    self._report(len(self.text), 100, force=True)
                     break
 
                 if self._jump_to is not None:
@@ -936,12 +1389,18 @@ class TypingWorker:
                                 pyautogui.press("right", presses=n, interval=0)
                                 cursor_in_original += n
                                 done += n
-                                self._emit_cursor(cursor_in_original)
-                                self.signals.progress.emit(int(done / total_work * 100))
+                                self._report(cursor_in_original, int(done / total_work * 100))
                         if restart or self._stopped:
                             break
                     else:
-                        for ch, word_len in _iter_chars_with_word_len(op.new_text):
+                        # Move over unchanged text in chunks: one key call and
+                        # one sleep per chunk. A chunk ends early after a
+                        # sentence end or word boundary so pauses still land
+                        # on the same characters.
+                        chars = op.new_text
+                        word_lens = _word_lens(chars)
+                        k = 0
+                        while k < len(chars):
                             if self._stopped:
                                 break
                             if self._jump_to is not None:
@@ -951,18 +1410,30 @@ class TypingWorker:
                                 self._handle_pause(cursor_in_original)
                                 if self._stopped:
                                     break
-                            pyautogui.press("right")
-                            cursor_in_original += 1
-                            done += 1
-                            self._emit_cursor(cursor_in_original)
-                            self.signals.progress.emit(int(done / total_work * 100))
-                            delay = self._char_delay(ch, word_len) * 0.3
-                            self._last_delay = delay
+                            chunk_start = k
+                            delay = 0.0
+                            word_pause = False
+                            while k < len(chars) and k - chunk_start < _EQUAL_CHUNK:
+                                ch = chars[k]
+                                char_delay = self._char_delay(ch, word_lens[k]) * 0.3
+                                k += 1
+                                self._last_delay = char_delay
+                                delay += char_delay
+                                cls = _char_class(ch)
+                                is_space = cls & _CH_SPACE
+                                word_pause = bool(is_space and prev_was_word)
+                                prev_was_word = not is_space
+                                if word_pause or cls & _CH_SENTENCE_END:
+                                    break
+                            n = k - chunk_start
+                            pyautogui.press("right", presses=n, interval=0)
+                            cursor_in_original += n
+                            done += n
+                            self._report(cursor_in_original, int(done / total_work * 100))
                             self._sleep(delay)
                             self._thinking_pause(ch)
-                            if ch in {" ", "\t", "\n"} and prev_was_word:
+                            if word_pause:
                                 self._maybe_word_pause()
-                            prev_was_word = ch not in whitespace
                         if restart:
                             break
 
@@ -971,22 +1442,22 @@ class TypingWorker:
                     if is_bot:
                         if n:
                             pyautogui.press("delete", presses=n, interval=0)
-                    elif use_select:
-                        for _ in range(n):
-                            if self._stopped:
-                                break
-                            if self._jump_to is not None:
-                                restart = True
-                                break
-                            if self._paused:
-                                self._handle_pause(cursor_in_original)
-                                if self._stopped:
-                                    break
-                            pyautogui.hotkey("shift", "right")
-                            self._sleep(self._scaled_delay(0.04))
+                    else:
+                        restart = self._select_forward(n, cursor_in_original)
                         pyautogui.press("delete")
+                    done += n
+                    self._report(cursor_in_original, int(done / total_work * 100))
+                    self._log(f"Deleted: '{_log_trunc(op.old_text)}'")
+                    if restart:
+                        break
+
+                elif op.kind == "insert":
+                    if is_bot:
+                        done, restart = self._type_batched(
+                            op.new_text, cursor_in_original, done, total_work
+                        )
                     else:
-                        for _ in range(n):
+                        for ch, word_len in zip(op.new_text, _word_lens(op.new_text)):
                             if self._stopped:
                                 break
                             if self._jump_to is not None:
@@ -996,36 +1467,16 @@ class TypingWorker:
                                 self._handle_pause(cursor_in_original)
                                 if self._stopped:
                                     break
-                            pyautogui.press("delete")
-                            self._sleep(self._scaled_delay(0.06))
-                    done += n
-                    self._emit_cursor(cursor_in_original)
-                    self.signals.progress.emit(int(done / total_work * 100))
-                    self.signals.log.emit(f"Deleted: '{op.old_text[:30]}'")
-                    if restart:
-                        break
-
-                elif op.kind == "insert":
-                    for ch, word_len in _iter_chars_with_word_len(op.new_text):
-                        if self._stopped:
-                            break
-                        if self._jump_to is not None:
-                            restart = True
-                            break
-                        if self._paused:
-                            self._handle_pause(cursor_in_original)
-                            if self._stopped:
-                                break
-                        self._type_char(ch)
-                        done += 1
-                        self._emit_cursor(cursor_in_original)
-                        self.signals.progress.emit(int(done / total_work * 100))
-                        self._sleep(self._char_delay(ch, word_len))
-                        self._thinking_pause(ch)
-                        if ch in {" ", "\t", "\n"} and prev_was_word:
-                            self._maybe_word_pause()
-                        prev_was_word = ch not in whitespace
-                    self.signals.log.emit(f"Inserted: '{op.new_text[:30]}'")
+                            self._type_char(ch)
+                            done += 1
+                            self._report(cursor_in_original, int(done / total_work * 100))
+                            self._sleep(self._char_delay(ch, word_len))
+                            self._thinking_pause(ch)
+                            is_space = not word_len  # 0 only for whitespace
+                            if is_space and prev_was_word:
+                                self._maybe_word_pause()
+                            prev_was_word = not is_space
+                    self._log(f"Inserted: '{_log_trunc(op.new_text)}'")
                     if restart:
                         break
 
@@ -1034,21 +1485,16 @@ class TypingWorker:
                     if is_bot:
                         if n_del:
                             pyautogui.press("delete", presses=n_del, interval=0)
-                    elif use_select:
-                        for _ in range(n_del):
-                            if self._stopped:
-                                break
-                            if self._jump_to is not None:
-                                restart = True
-                                break
-                            if self._paused:
-                                self._handle_pause(cursor_in_original)
-                                if self._stopped:
-                                    break
-                            pyautogui.hotkey("shift", "right")
-                            self._sleep(self._scaled_delay(0.04))
                     else:
-                        for _ in range(n_del):
+                        restart = self._select_forward(n_del, cursor_in_original)
+                    done += n_del
+
+                    if is_bot:
+                        done, restart = self._type_batched(
+                            op.new_text, cursor_in_original, done, total_work
+                        )
+                    else:
+                        for ch, word_len in zip(op.new_text, _word_lens(op.new_text)):
                             if self._stopped:
                                 break
                             if self._jump_to is not None:
@@ -1058,31 +1504,18 @@ class TypingWorker:
                                 self._handle_pause(cursor_in_original)
                                 if self._stopped:
                                     break
-                            pyautogui.press("delete")
-                            self._sleep(self._scaled_delay(0.06))
-                    done += n_del
-
-                    for ch, word_len in _iter_chars_with_word_len(op.new_text):
-                        if self._stopped:
-                            break
-                        if self._jump_to is not None:
-                            restart = True
-                            break
-                        if self._paused:
-                            self._handle_pause(cursor_in_original)
-                            if self._stopped:
-                                break
-                        self._type_char(ch)
-                        done += 1
-                        self._emit_cursor(cursor_in_original)
-                        self.signals.progress.emit(int(done / total_work * 100))
-                        self._sleep(self._char_delay(ch, word_len))
-                        self._thinking_pause(ch)
-                        if ch in {" ", "\t", "\n"} and prev_was_word:
-                            self._maybe_word_pause()
-                        prev_was_word = ch not in whitespace
-                    self.signals.log.emit(
-                        f"Replaced: '{op.old_text[:20]}' → '{op.new_text[:20]}'"
+                            self._type_char(ch)
+                            done += 1
+                            self._report(cursor_in_original, int(done / total_work * 100))
+                            self._sleep(self._char_delay(ch, word_len))
+                            self._thinking_pause(ch)
+                            is_space = not word_len  # 0 only for whitespace
+                            if is_space and prev_was_word:
+                                self._maybe_word_pause()
+                            prev_was_word = not is_space
+                    self._log(
+                        f"Replaced: '{_log_trunc(op.old_text, 20)}' → "
+                        f"'{_log_trunc(op.new_text, 20)}'"
                     )
                     if restart:
                         break
@@ -1105,6 +1538,7 @@ class CursorOverlay(QWidget):
         super().__init__(text_edit.viewport())
         self._text_edit = text_edit
         self._char_pos = 0
+        self._cached_key = None  # (pos, revision, scroll, viewport size) of _cursor_rect
         self._visible = False
         self._blink_on = True
         self.setAttribute(Qt.WidgetAttribute.WA_TransparentForMouseEvents)
@@ -1114,6 +1548,8 @@ class CursorOverlay(QWidget):
         self._blink_timer = QTimer(self)
         self._blink_timer.setInterval(530)
         self._blink_timer.timeout.connect(self._toggle_blink)
+        # Blinking is only worth repainting for while the app is in front
+        QApplication.instance().applicationStateChanged.connect(self._sync_blink)
 
         self.hide()
 
@@ -1121,8 +1557,8 @@ class CursorOverlay(QWidget):
         self._char_pos = pos
         self._visible = True
         self._blink_on = True
-        self._blink_timer.start()
         self.show()
+        self._sync_blink()
         self._reposition()
 
     def stop(self):
@@ -1131,33 +1567,109 @@ class CursorOverlay(QWidget):
         self.hide()
 
     def set_position(self, pos: int):
+        # Always reposition: _reposition's cache key skips the work when
+        # neither the position, the text nor the scroll offset moved
         self._char_pos = pos
         self._blink_on = True
         self._reposition()
 
+    def showEvent(self, event):
+        super().showEvent(event)
+        self._sync_blink()
+
+    def hideEvent(self, event):
+        super().hideEvent(event)
+        self._blink_timer.stop()
+
+    def _sync_blink(self, *_):
+        """Run the blink timer only while shown and the app is active;
+        otherwise hold the bar steady."""
+        active = QApplication.applicationState() == Qt.ApplicationState.ApplicationActive
+        if self._visible and self.isVisible() and active:
+            if not self._blink_timer.isActive():
+                self._blink_timer.start()
+        else:
+            self._blink_timer.stop()
+            if not self._blink_on:
+                self._blink_on = True
+                self._update_bar()
+
+    def _bar_rect(self) -> QRect:
+        r = self._cursor_rect
+        return QRect(r.x() - 1, r.y() - 1, 4, r.height() + 2)
+
+    def _update_bar(self):
+        # Repaint just the bar instead of the whole viewport-sized overlay
+        if hasattr(self, "_cursor_rect"):
+            self.update(self._bar_rect())
+
     def _toggle_blink(self):
         self._blink_on = not self._blink_on
-        self.update()
+        self._update_bar()
 
     def _reposition(self):
         te = self._text_edit
         doc = te.document()
         text_len = doc.characterCount() - 1  # doc adds trailing \n
         pos = min(self._char_pos, max(0, text_len))
-
-        cursor = QTextCursor(doc)
-        cursor.setPosition(pos)
-        rect = te.cursorRect(cursor)
-
-        # Scroll the text edit so the cursor is visible
-        te.setTextCursor(cursor)
-        te.ensureCursorVisible()
+        vp = te.viewport()
+        vbar = te.verticalScrollBar()
+
+        # cursorRect is in viewport coordinates, so it only needs redoing
+        # when the position, the text, either scroll offset or the wrap
+        # width changes
+        key = (
+            pos,
+            doc.revision(),
+            vbar.value(),
+            te.horizontalScrollBar().value(),
+            vp.size(),
+        )
+        if key == self._cached_key:
+            rect = self._cursor_rect
+        else:
+            cursor = QTextCursor(doc)
+            cursor.setPosition(pos)
+            rect = te.cursorRect(cursor)
+            # Scroll the text edit only when the cursor has left the viewport.
+            # The editor's own cursor stays put, so the worker never clobbers
+            # the user's selection; the window tracks the typing position
+            # for the manual start from the worker's reports instead.
+            if not vp.rect().contains(rect):
+                self._scroll_to(cursor, rect)
+                rect = te.cursorRect(cursor)
+            self._cached_key = key
 
         # Place overlay to cover entire viewport
-        vp = te.viewport()
-        self.setGeometry(0, 0, vp.width(), vp.height())
+        if self.geometry() != vp.rect():
+            self.setGeometry(vp.rect())
+        self._update_bar()
         self._cursor_rect = rect
-        self.update()
+        self._update_bar()
+
+    def _scroll_to(self, cursor: QTextCursor, rect: QRect):
+        """Scroll so *cursor* is in view, like ensureCursorVisible but
+        without moving the text cursor."""
+        te = self._text_edit
+        vp = te.viewport()
+        if rect.top() < 0 or rect.bottom() > vp.height():
+            # QPlainTextEdit's vertical scroll bar counts layout lines
+            block = cursor.block()
+            layout = block.layout()
+            line = block.firstLineNumber()
+            if layout is not None:
+                text_line = layout.lineForTextPosition(cursor.positionInBlock())
+                if text_line.isValid():
+                    line += text_line.lineNumber()
+            vbar = te.verticalScrollBar()
+            if rect.top() < 0:
+                vbar.setValue(line)
+            else:
+                visible = max(1, vp.height() // max(1, rect.height()))
+                vbar.setValue(line - visible + 1)
+        if rect.left() < 0 or rect.right() > vp.width():
+            hbar = te.horizontalScrollBar()
+            hbar.setValue(hbar.value() + rect.left() - vp.width() // 2)
 
     def paintEvent(self, event):
         if not self._visible or not self._blink_on:
@@ -1183,10 +1695,21 @@ class FlowLayout(QLayout):
         super().__init__(parent)
         self._items: list[QLayoutItem] = []
         self._spacing = spacing
+        # heightForWidth results and the last laid-out rect, dropped whenever
+        # Qt invalidates the layout (items added/removed, size hints changed)
+        self._hfw_cache: dict[int, int] = {}
+        self._laid_out_rect: QRect | None = None
         self.setContentsMargins(margin, margin, margin, margin)
 
+    def invalidate(self):
+        if hasattr(self, "_hfw_cache"):
+            self._hfw_cache.clear()
+            self._laid_out_rect = None
+        super().invalidate()
+
     def addItem(self, item: QLayoutItem):
         self._items.append(item)
+        self.invalidate()
 
     def count(self):
         return len(self._items)
@@ -1198,7 +1721,9 @@ class FlowLayout(QLayout):
 
     def takeAt(self, index):
         if 0 <= index < len(self._items):
-            return self._items.pop(index)
+            item = self._items.pop(index)
+            self.invalidate()
+            return item
         return None
 
     def expandingDirections(self):
@@ -1208,11 +1733,18 @@ class FlowLayout(QLayout):
         return True
 
     def heightForWidth(self, width):
-        return self._do_layout(QRect(0, 0, width, 0), test_only=True)
+        height = self._hfw_cache.get(width)
+        if height is None:
+            height = self._do_layout(QRect(0, 0, width, 0), test_only=True)
+            self._hfw_cache[width] = height
+        return height
 
     def setGeometry(self, rect):
         super().setGeometry(rect)
+        if rect == self._laid_out_rect:
+            return
         self._do_layout(rect, test_only=False)
+        self._laid_out_rect = QRect(rect)
 
     def sizeHint(self):
         return self.minimumSize()
@@ -1249,6 +1781,35 @@ class FlowLayout(QLayout):
 # ---------------------------------------------------------------------------
 # Hotkey configuration dialog
 # ---------------------------------------------------------------------------
+# Stylesheets depend only on the palette, so they're built once at import
+_DIALOG_QSS = f"""
+    QDialog {{ background: {BASE}; color: {TEXT}; }}
+    QLabel {{ color: {TEXT}; font-size: 13px; }}
+    QPushButton {{
+        background: {SURFACE0}; color: {TEXT};
+        border: 1px solid {SURFACE1}; border-radius: 6px;
+        padding: 6px 14px; font-size: 13px;
+    }}
+    QPushButton:hover {{ background: {SURFACE1}; }}
+    QPushButton:focus {{ border-color: {LAVENDER}; }}
+"""
+_HINT_QSS = f"color: {SUBTEXT0}; font-size: 12px; margin-bottom: 4px;"
+_OK_BTN_QSS = f"background: {BLUE}; color: {CRUST}; font-weight: bold;"
+_BTN_ACTIVE_QSS = (
+    f"background: {SURFACE1}; color: {YELLOW}; border: 1px solid {YELLOW}; "
+    f"border-radius: 6px; padding: 6px 14px; font-size: 13px;"
+)
+_BTN_IDLE_QSS = (
+    f"background: {SURFACE0}; color: {TEXT}; border: 1px solid {SURFACE1}; "
+    f"border-radius: 6px; padding: 6px 14px; font-size: 13px;"
+)
+
+
+@functools.lru_cache(maxsize=128)
+def _key_name(key) -> str:
+    return QKeySequence(key).toString()
+
+
 class HotkeyDialog(QDialog):
     def __init__(self, current: dict, parent=None):
         super().__init__(parent)
@@ -1256,17 +1817,7 @@ class HotkeyDialog(QDialog):
         self.setFixedSize(380, 320)
         if _ICON_PATH.exists():
             self.setWindowIcon(QIcon(str(_ICON_PATH)))
-        self.setStyleSheet(f"""
-            QDialog {{ background: {BASE}; color: {TEXT}; }}
-            QLabel {{ color: {TEXT}; font-size: 13px; }}
-            QPushButton {{
-                background: {SURFACE0}; color: {TEXT};
-                border: 1px solid {SURFACE1}; border-radius: 6px;
-                padding: 6px 14px; font-size: 13px;
-            }}
-            QPushButton:hover {{ background: {SURFACE1}; }}
-            QPushButton:focus {{ border-color: {LAVENDER}; }}
-        """)
+        self.setStyleSheet(_DIALOG_QSS)
 
         self.hotkeys = dict(current)
         self._active_button: QPushButton | None = None
@@ -1277,7 +1828,7 @@ class HotkeyDialog(QDialog):
 
         title = QLabel("Press a button, then press the desired key(s).")
         title.setWordWrap(True)
-        title.setStyleSheet(f"color: {SUBTEXT0}; font-size: 12px; margin-bottom: 4px;")
+        title.setStyleSheet(_HINT_QSS)
         layout.addWidget(title)
 
         self._buttons: dict[str, QPushButton] = {}
@@ -1287,7 +1838,7 @@ class HotkeyDialog(QDialog):
             lbl.setFixedWidth(60)
             btn = QPushButton(self.hotkeys.get(action, DEFAULT_HOTKEYS[action]))
             btn.setFixedHeight(32)
-            btn.clicked.connect(lambda checked=False, a=action, b=btn: self._begin_capture(a, b))
+            btn.clicked.connect(functools.partial(self._begin_capture, action, btn))
             self._buttons[action] = btn
             row.addWidget(lbl)
             row.addWidget(btn)
@@ -1300,22 +1851,19 @@ class HotkeyDialog(QDialog):
         reset_btn.clicked.connect(self._reset)
         ok_btn = QPushButton("OK")
         ok_btn.clicked.connect(self.accept)
-        ok_btn.setStyleSheet(f"background: {BLUE}; color: {CRUST}; font-weight: bold;")
+        ok_btn.setStyleSheet(_OK_BTN_QSS)
         btn_row.addWidget(reset_btn)
         btn_row.addStretch()
         btn_row.addWidget(ok_btn)
         layout.addLayout(btn_row)
 
-    def _begin_capture(self, action: str, btn: QPushButton):
+    def _begin_capture(self, action: str, btn: QPushButton, _checked: bool = False):
         if self._active_button and self._active_button is not btn:
             self._active_button.setText(self.hotkeys.get(self._active_action, ""))
         self._active_action = action
         self._active_button = btn
         btn.setText("Press a key…")
-        btn.setStyleSheet(
-            f"background: {SURFACE1}; color: {YELLOW}; border: 1px solid {YELLOW}; "
-            f"border-radius: 6px; padding: 6px 14px; font-size: 13px;"
-        )
+        btn.setStyleSheet(_BTN_ACTIVE_QSS)
         btn.setFocus()
 
     def keyPressEvent(self, event):
@@ -1335,16 +1883,13 @@ class HotkeyDialog(QDialog):
         if key in (Qt.Key.Key_Control, Qt.Key.Key_Alt, Qt.Key.Key_Shift,
                    Qt.Key.Key_Meta, Qt.Key.Key_AltGr):
             return
-        key_name = QKeySequence(key).toString()
+        key_name = _key_name(key)
         if key_name:
             parts.append(key_name)
         combo = "+".join(parts) if parts else "Unknown"
         self.hotkeys[self._active_action] = combo
         self._active_button.setText(combo)
-        self._active_button.setStyleSheet(
-            f"background: {SURFACE0}; color: {TEXT}; border: 1px solid {SURFACE1}; "
-            f"border-radius: 6px; padding: 6px 14px; font-size: 13px;"
-        )
+        self._active_button.setStyleSheet(_BTN_IDLE_QSS)
         self._active_button = None
         self._active_action = None
 
@@ -1354,36 +1899,276 @@ class HotkeyDialog(QDialog):
             btn.setText(DEFAULT_HOTKEYS[action])
 
 
+# ---------------------------------------------------------------------------
+# Main window stylesheet
+# ---------------------------------------------------------------------------
+# Spin box arrows, compiled into resources_rc.py from resources.qrc (run
+# `pyside6-rcc resources.qrc -o resources_rc.py` after editing them). Qt
+# doesn't load data: URIs in stylesheets, and resource lookups stay in
+# memory instead of touching PyInstaller's extraction folder.
+_SPIN_UP_URI = ":/arrows/up.svg"
+_SPIN_DOWN_URI = ":/arrows/down.svg"
+
+
+# Colours buttons can pick through their "accent" property
+_ACCENT_COLORS = (GREEN, YELLOW, RED, BLUE, PINK)
+
+
+def _accent_qss() -> str:
+    return "".join(
+        f"""
+    QPushButton[accent="{color}"] {{ color: {color}; }}
+    QPushButton[accent="{color}"]:hover, QPushButton[accent="{color}"]:pressed {{
+        background: {color}; color: {CRUST};
+    }}"""
+        for color in _ACCENT_COLORS
+    )
+
+
+@functools.lru_cache(maxsize=4)
+def _build_main_qss(up_uri: str, dn_uri: str) -> str:
+    """The main window stylesheet; only the spin box arrows vary."""
+    return f"""
+    QMainWindow, QWidget {{
+        background: {BASE}; color: {TEXT};
+        font-family: "Segoe UI", "Inter", sans-serif; font-size: 13px;
+    }}
+    QGroupBox {{
+        border: 1px solid {SURFACE1}; border-radius: 8px;
+        margin-top: 14px; padding: 10px 6px 6px 6px;
+        color: {TEXT}; font-weight: bold;
+    }}
+    QGroupBox::title {{
+        subcontrol-origin: margin; subcontrol-position: top left;
+        padding: 2px 8px;
+    }}
+    QPlainTextEdit, QTextEdit {{
+        background: {MANTLE}; color: {TEXT};
+        border: 1px solid {SURFACE0}; border-radius: 6px; padding: 6px;
+        font-family: "Cascadia Code", "Consolas", monospace; font-size: 13px;
+        selection-background-color: {SURFACE1};
+    }}
+    QScrollArea {{
+        background: {MANTLE}; border: 1px solid {SURFACE0}; border-radius: 6px;
+    }}
+    QLabel {{
+        color: {SUBTEXT1}; font-size: 12px; background: transparent;
+    }}
+    QComboBox {{
+        background: {SURFACE0}; color: {TEXT};
+        border: 1px solid {SURFACE1}; border-radius: 6px;
+        padding: 4px 10px; min-width: 120px;
+    }}
+    QComboBox::drop-down {{ border: none; width: 20px; }}
+    QComboBox QAbstractItemView {{
+        background: {SURFACE0}; color: {TEXT};
+        selection-background-color: {SURFACE1}; border: 1px solid {SURFACE1};
+    }}
+    QSpinBox, QDoubleSpinBox {{
+        background: {SURFACE0}; color: {TEXT};
+        border: 1px solid {SURFACE1}; border-radius: 6px;
+        padding: 2px 4px; font-size: 12px;
+    }}
+    QSpinBox::up-button, QDoubleSpinBox::up-button {{
+        subcontrol-origin: border; subcontrol-position: top right;
+        width: 18px; border: none;
+        border-left: 1px solid {SURFACE1}; border-top-right-radius: 6px;
+        image: url("{up_uri}");
+    }}
+    QSpinBox::down-button, QDoubleSpinBox::down-button {{
+        subcontrol-origin: border; subcontrol-position: bottom right;
+        width: 18px; border: none;
+        border-left: 1px solid {SURFACE1}; border-bottom-right-radius: 6px;
+        image: url("{dn_uri}");
+    }}
+    QSpinBox::up-button:hover, QDoubleSpinBox::up-button:hover,
+    QSpinBox::down-button:hover, QDoubleSpinBox::down-button:hover {{
+        background: {SURFACE1};
+    }}
+    QProgressBar {{
+        background: {SURFACE0}; border: 1px solid {SURFACE1};
+        border-radius: 7px; text-align: center;
+    }}
+    QProgressBar::chunk {{
+        background: {BLUE}; border-radius: 6px;
+    }}
+    QPushButton {{
+        background: {SURFACE0}; color: {TEXT};
+        border: 1px solid {SURFACE1}; border-radius: 6px;
+        padding: 5px 14px; font-size: 13px; font-weight: 600;
+    }}
+    QPushButton:hover {{ background: {SURFACE1}; }}
+    QPushButton:pressed {{ background: {SURFACE2}; }}
+    QPushButton#infoBtn {{
+        background: {SURFACE0}; color: {LAVENDER};
+        border: 1px solid {SURFACE1}; border-radius: 14px;
+        font-size: 14px; font-weight: bold; padding: 0px;
+    }}
+    QPushButton#infoBtn:hover {{
+        background: {SURFACE1}; border-color: {LAVENDER};
+    }}
+    QPushButton#settingsToggle {{
+        background: {MANTLE}; color: {SUBTEXT0};
+        border: 1px solid {SURFACE0}; border-radius: 4px;
+        padding: 2px 10px; font-size: 12px; font-weight: 600;
+        text-align: left;
+    }}
+    QPushButton#settingsToggle:hover {{
+        background: {SURFACE0}; color: {TEXT};
+    }}
+    QLabel#pauseToast {{
+        background: {SURFACE0}; color: {TEXT};
+        border: 1px solid {YELLOW}; border-radius: 8px;
+        padding: 10px 14px; font-size: 13px;
+    }}
+    QSplitter::handle {{
+        background: {SURFACE1}; width: 3px; border-radius: 1px;
+    }}
+    QStatusBar {{
+        background: {MANTLE}; color: {SUBTEXT0};
+        border-top: 1px solid {SURFACE0}; font-size: 12px;
+    }}
+    QScrollBar:vertical {{
+        background: {MANTLE}; width: 10px; border-radius: 5px;
+    }}
+    QScrollBar::handle:vertical {{
+        background: {SURFACE1}; min-height: 30px; border-radius: 5px;
+    }}
+    QScrollBar::add-line:vertical, QScrollBar::sub-line:vertical {{ height: 0px; }}
+    QScrollBar:horizontal {{
+        background: {MANTLE}; height: 10px; border-radius: 5px;
+    }}
+    QScrollBar::handle:horizontal {{
+        background: {SURFACE1}; min-width: 30px; border-radius: 5px;
+    }}
+    QScrollBar::add-line:horizontal, QScrollBar::sub-line:horizontal {{ width: 0px; }}
+    """ + _accent_qss()
+
+
 # ---------------------------------------------------------------------------
 # Main window
 # ---------------------------------------------------------------------------
 class HumanTextEditor(QMainWindow):
     """Human Text Editor – simulates realistic typing."""
 
+    # Collapsed / expanded captions of the section toggles, indexed by state
+    _SETTINGS_LABELS = ("▶ Settings", "▼ Settings")
+    _LOG_LABELS = ("▶ Activity Log", "▼ Activity Log")
+
+    # Marshals (fn, args, kwargs) from hotkey threads onto the GUI thread
+    _ui_dispatch = Signal(object, object, object)
+
     def __init__(self):
         super().__init__()
+        self._ui_dispatch.connect(self._run_on_ui, Qt.ConnectionType.QueuedConnection)
         self.setWindowTitle("Human Text Editor (HTE)")
         if _ICON_PATH.exists():
             self.setWindowIcon(QIcon(str(_ICON_PATH)))
         self.resize(900, 640)
 
         self._worker: TypingWorker | None = None
-        self._hotkey_hooks: list = []
+        self._hotkey_hooks: dict = {}  # action -> keyboard hook
+        self._last_registered: dict = {}  # action -> combo currently registered
         self._win_hotkeys = None
         self._manual_start_pos_fresh = 0
         self._manual_start_pos_replace = 0
+        self._run_start_pos = 0  # manual start the current run began from
+
+        # Diff previews are rendered on the thread pool; only the result of
+        # the latest request is shown
+        self._diff_signals = DiffSignals(self)
+        self._diff_signals.ready.connect(self._on_diff_ready)
+        self._diff_request = 0
+        self._diff_status = ""
+        self._diff_pending = ("", "")
+        self._diff_shown = ("", "")  # Inputs of the diff currently on screen
+        self._diff_cache: tuple[str, str, list] | None = None  # (orig, repl, ops)
+        # Clicks and edits within one window coalesce into a single rebuild
+        self._diff_timer = QTimer(self)
+        self._diff_timer.setSingleShot(True)
+        self._diff_timer.setInterval(120)
+        self._diff_timer.setTimerType(Qt.TimerType.CoarseTimer)
+        self._diff_timer.timeout.connect(self._build_diff_preview_impl)
+
+        # Worker cursor updates are applied at most once per frame
+        self._pending_cursor_pos: int | None = None
+        self._cursor_timer = QTimer(self)
+        self._cursor_timer.setSingleShot(True)
+        self._cursor_timer.setInterval(16)
+        self._cursor_timer.setTimerType(Qt.TimerType.CoarseTimer)
+        self._cursor_timer.timeout.connect(self._apply_cursor_pos)
+
+        # Log lines from the GUI and the worker reach the view every 50 ms
+        self._log_lines: list[str] = []
+        self._ts_second = -1
+        self._ts_text = ""
+
+        # Pause notice: a tooltip-style window shown over the app, hidden
+        # again after a few seconds
+        self._pause_toast = QLabel(self, Qt.WindowType.ToolTip)
+        self._pause_toast.setObjectName("pauseToast")
+        self._pause_toast.setWordWrap(True)
+        self._pause_toast.setMaximumWidth(420)
+        self._pause_toast.hide()
+        self._toast_timer = QTimer(self)
+        self._toast_timer.setSingleShot(True)
+        self._toast_timer.setInterval(3000)
+        self._toast_timer.setTimerType(Qt.TimerType.CoarseTimer)
+        self._toast_timer.timeout.connect(self._pause_toast.hide)
+        self._log_flush_timer = QTimer(self)
+        self._log_flush_timer.setSingleShot(True)
+        self._log_flush_timer.setInterval(50)
+        self._log_flush_timer.setTimerType(Qt.TimerType.CoarseTimer)
+        self._log_flush_timer.timeout.connect(self._flush_log_lines)
 
         # Load ALL settings
         self._settings = _load_settings()
         self._hotkeys = self._settings.get("hotkeys", dict(DEFAULT_HOTKEYS))
         self._settings_expanded = self._settings.get("settings_expanded", True)
 
+        # toPlainText() copies the whole document; keep one copy per edit
+        self._plain_cache: dict = {}
         self._build_ui()
+        for edit in (self._your_text, self._original_text, self._replacement_text):
+            edit.textChanged.connect(functools.partial(self._plain_cache.pop, edit, None))
+        self._plain_cache.clear()
+        self._last_qss_hash = None
         self._apply_styles()
         self._restore_settings()
+        self._hotkey_actions = {
+            "start": self._on_start,
+            "pause": self._on_pause,
+            "skip": self._on_skip,
+            "stop": self._on_stop,
+        }
+        # keyboard calls these on its own thread; built once, not per register
+        self._hotkey_callbacks = {
+            action: functools.partial(self._invoke_ui, fn)
+            for action, fn in self._hotkey_actions.items()
+        }
         self._register_global_hotkeys()
 
-        # Auto-save timer – saves settings periodically and on text changes
+        # Only edits after the restore count as unsaved changes
+        self._dirty = False
+        for edit in (self._your_text, self._original_text, self._replacement_text):
+            edit.textChanged.connect(self._mark_dirty)
+        for spin in (self._wpm_spin, self._variability_spin, self._typo_spin,
+                     self._countdown_spin):
+            spin.valueChanged.connect(self._mark_dirty)
+        for combo in (self._mode_combo, self._type_combo):
+            combo.currentIndexChanged.connect(self._mark_dirty)
+        for edit in (self._original_text, self._replacement_text):
+            edit.textChanged.connect(self._on_diff_input_changed)
+
+        # Saves run on their own one-thread pool, in order, and are tagged
+        # with a generation; a failed one marks the state unsaved
+        self._save_pool = QThreadPool(self)
+        self._save_pool.setMaxThreadCount(1)
+        self._save_generation = 0
+        self._save_signals = SaveSignals(self)
+        self._save_signals.failed.connect(self._mark_dirty)
+
+        # Auto-save timer – saves settings periodically when something changed
         self._save_timer = QTimer(self)
         self._save_timer.setInterval(2000)
         self._save_timer.timeout.connect(self._persist_all)
@@ -1505,9 +2290,7 @@ class HumanTextEditor(QMainWindow):
         root.addWidget(self._settings_widget)
 
         self._settings_widget.setVisible(self._settings_expanded)
-        self._settings_toggle.setText(
-            "▼ Settings" if self._settings_expanded else "▶ Settings"
-        )
+        self._settings_toggle.setText(self._SETTINGS_LABELS[self._settings_expanded])
 
         # === FRESH TYPE: single text area ===
         self._fresh_group = QGroupBox("Your Text")
@@ -1561,6 +2344,7 @@ class HumanTextEditor(QMainWindow):
         self._diff_view = QTextEdit()
         self._diff_view.setReadOnly(True)
         self._diff_view.setAcceptRichText(True)
+        self._diff_view.setUndoRedoEnabled(False)
         self._diff_view.setLineWrapMode(QTextEdit.LineWrapMode.WidgetWidth)
         self._diff_view.setFixedHeight(140)
         diff_lay.addWidget(self._diff_view)
@@ -1630,6 +2414,16 @@ class HumanTextEditor(QMainWindow):
         self._fresh_cursor.set_position(0)
         self._orig_cursor.set_position(0)
 
+    def _plain_text(self, edit: QPlainTextEdit) -> str:
+        text = self._plain_cache.get(edit)
+        if text is None:
+            text = self._plain_cache[edit] = edit.toPlainText()
+        return text
+
+    def _text_length(self, edit: QPlainTextEdit) -> int:
+        # O(1), without copying the document out; Qt counts a final separator
+        return edit.document().characterCount() - 1
+
     def _update_manual_progress(self, pos: int, total: int, label: str):
         if self._worker and not self._worker._paused:
             return
@@ -1648,7 +2442,7 @@ class HumanTextEditor(QMainWindow):
             self._worker._start_pos = pos
             self._worker.request_jump(pos)
         self._fresh_cursor.set_position(pos)
-        self._update_manual_progress(pos, len(self._your_text.toPlainText()), "Fresh")
+        self._update_manual_progress(pos, self._text_length(self._your_text), "Fresh")
 
     def _on_original_cursor_moved(self):
         pos = self._original_text.textCursor().position()
@@ -1659,13 +2453,20 @@ class HumanTextEditor(QMainWindow):
             self._worker._start_pos = pos
             self._worker.request_jump(pos)
         self._orig_cursor.set_position(pos)
-        self._update_manual_progress(pos, len(self._original_text.toPlainText()), "Replace")
+        self._update_manual_progress(pos, self._text_length(self._original_text), "Replace")
 
     # -----------------------------------------------------------------------
     # Settings persistence – save & restore everything
     # -----------------------------------------------------------------------
-    def _persist_all(self):
-        """Save all widget states + text contents to JSON."""
+    def _mark_dirty(self, *_):
+        self._dirty = True
+
+    def _persist_all(self, blocking: bool = False):
+        """Save all widget states + text contents to JSON, if anything changed."""
+        # Only the snapshot is taken here; the dump and write run on the
+        # save pool unless blocking (on close)
+        if not self._dirty and not blocking:
+            return
         self._settings["hotkeys"] = self._hotkeys
         self._settings["settings_expanded"] = self._settings_expanded
         self._settings["mode"] = self._mode_combo.currentIndex()
@@ -1675,10 +2476,17 @@ class HumanTextEditor(QMainWindow):
         self._settings["type_mode"] = self._type_combo.currentText()
         self._settings.pop("edit_style", None)
         self._settings["countdown"] = self._countdown_spin.value()
-        self._settings["your_text"] = self._your_text.toPlainText()
-        self._settings["original_text"] = self._original_text.toPlainText()
-        self._settings["replacement_text"] = self._replacement_text.toPlainText()
-        _save_settings(self._settings)
+        self._settings["your_text"] = self._plain_text(self._your_text)
+        self._settings["original_text"] = self._plain_text(self._original_text)
+        self._settings["replacement_text"] = self._plain_text(self._replacement_text)
+        data = dict(self._settings)
+        self._dirty = False
+        self._save_generation += 1
+        if blocking:
+            if not _save_settings(data, self._save_generation):
+                self._dirty = True
+        else:
+            self._save_pool.start(SaveTask(data, self._save_generation, self._save_signals))
 
     def _restore_settings(self):
         """Restore all widget states from loaded settings."""
@@ -1700,166 +2508,32 @@ class HumanTextEditor(QMainWindow):
     # Styling
     # -----------------------------------------------------------------------
     def _apply_styles(self):
-        up_svg = (
-            '<svg xmlns="http://www.w3.org/2000/svg" width="10" height="10" viewBox="0 0 10 10">'
-            f'<polygon points="5,2 9,8 1,8" fill="{TEXT}"/>'
-            "</svg>"
-        )
-        down_svg = (
-            '<svg xmlns="http://www.w3.org/2000/svg" width="10" height="10" viewBox="0 0 10 10">'
-            f'<polygon points="5,8 9,2 1,2" fill="{TEXT}"/>'
-            "</svg>"
-        )
-        up_b64 = base64.b64encode(up_svg.encode()).decode()
-        dn_b64 = base64.b64encode(down_svg.encode()).decode()
-        up_uri = f"data:image/svg+xml;base64,{up_b64}"
-        dn_uri = f"data:image/svg+xml;base64,{dn_b64}"
-
-        self.setStyleSheet(f"""
-            QMainWindow, QWidget {{
-                background: {BASE}; color: {TEXT};
-                font-family: "Segoe UI", "Inter", sans-serif; font-size: 13px;
-            }}
-            QGroupBox {{
-                border: 1px solid {SURFACE1}; border-radius: 8px;
-                margin-top: 14px; padding: 10px 6px 6px 6px;
-                color: {TEXT}; font-weight: bold;
-            }}
-            QGroupBox::title {{
-                subcontrol-origin: margin; subcontrol-position: top left;
-                padding: 2px 8px;
-            }}
-            QPlainTextEdit, QTextEdit {{
-                background: {MANTLE}; color: {TEXT};
-                border: 1px solid {SURFACE0}; border-radius: 6px; padding: 6px;
-                font-family: "Cascadia Code", "Consolas", monospace; font-size: 13px;
-                selection-background-color: {SURFACE1};
-            }}
-            QScrollArea {{
-                background: {MANTLE}; border: 1px solid {SURFACE0}; border-radius: 6px;
-            }}
-            QLabel {{
-                color: {SUBTEXT1}; font-size: 12px; background: transparent;
-            }}
-            QComboBox {{
-                background: {SURFACE0}; color: {TEXT};
-                border: 1px solid {SURFACE1}; border-radius: 6px;
-                padding: 4px 10px; min-width: 120px;
-            }}
-            QComboBox::drop-down {{ border: none; width: 20px; }}
-            QComboBox QAbstractItemView {{
-                background: {SURFACE0}; color: {TEXT};
-                selection-background-color: {SURFACE1}; border: 1px solid {SURFACE1};
-            }}
-            QSpinBox, QDoubleSpinBox {{
-                background: {SURFACE0}; color: {TEXT};
-                border: 1px solid {SURFACE1}; border-radius: 6px;
-                padding: 2px 4px; font-size: 12px;
-            }}
-            QSpinBox::up-button, QDoubleSpinBox::up-button {{
-                subcontrol-origin: border; subcontrol-position: top right;
-                width: 18px; border: none;
-                border-left: 1px solid {SURFACE1}; border-top-right-radius: 6px;
-                image: url("{up_uri}");
-            }}
-            QSpinBox::down-button, QDoubleSpinBox::down-button {{
-                subcontrol-origin: border; subcontrol-position: bottom right;
-                width: 18px; border: none;
-                border-left: 1px solid {SURFACE1}; border-bottom-right-radius: 6px;
-                image: url("{dn_uri}");
-            }}
-            QSpinBox::up-button:hover, QDoubleSpinBox::up-button:hover,
-            QSpinBox::down-button:hover, QDoubleSpinBox::down-button:hover {{
-                background: {SURFACE1};
-            }}
-            QProgressBar {{
-                background: {SURFACE0}; border: 1px solid {SURFACE1};
-                border-radius: 7px; text-align: center;
-            }}
-            QProgressBar::chunk {{
-                background: {BLUE}; border-radius: 6px;
-            }}
-            QPushButton {{
-                background: {SURFACE0}; color: {TEXT};
-                border: 1px solid {SURFACE1}; border-radius: 6px;
-                padding: 5px 14px; font-size: 13px; font-weight: 600;
-            }}
-            QPushButton:hover {{ background: {SURFACE1}; }}
-            QPushButton:pressed {{ background: {SURFACE2}; }}
-            QPushButton#infoBtn {{
-                background: {SURFACE0}; color: {LAVENDER};
-                border: 1px solid {SURFACE1}; border-radius: 14px;
-                font-size: 14px; font-weight: bold; padding: 0px;
-            }}
-            QPushButton#infoBtn:hover {{
-                background: {SURFACE1}; border-color: {LAVENDER};
-            }}
-            QPushButton#settingsToggle {{
-                background: {MANTLE}; color: {SUBTEXT0};
-                border: 1px solid {SURFACE0}; border-radius: 4px;
-                padding: 2px 10px; font-size: 12px; font-weight: 600;
-                text-align: left;
-            }}
-            QPushButton#settingsToggle:hover {{
-                background: {SURFACE0}; color: {TEXT};
-            }}
-            QSplitter::handle {{
-                background: {SURFACE1}; width: 3px; border-radius: 1px;
-            }}
-            QStatusBar {{
-                background: {MANTLE}; color: {SUBTEXT0};
-                border-top: 1px solid {SURFACE0}; font-size: 12px;
-            }}
-            QScrollBar:vertical {{
-                background: {MANTLE}; width: 10px; border-radius: 5px;
-            }}
-            QScrollBar::handle:vertical {{
-                background: {SURFACE1}; min-height: 30px; border-radius: 5px;
-            }}
-            QScrollBar::add-line:vertical, QScrollBar::sub-line:vertical {{ height: 0px; }}
-            QScrollBar:horizontal {{
-                background: {MANTLE}; height: 10px; border-radius: 5px;
-            }}
-            QScrollBar::handle:horizontal {{
-                background: {SURFACE1}; min-width: 30px; border-radius: 5px;
-            }}
-            QScrollBar::add-line:horizontal, QScrollBar::sub-line:horizontal {{ width: 0px; }}
-        """)
-
-        for btn, color in [
-            (self._start_btn, GREEN),
-            (self._pause_btn, YELLOW),
-            (self._stop_btn, RED),
-            (self._skip_btn, BLUE),
-            (self._support_btn, PINK),
-        ]:
-            btn.setStyleSheet(f"""
-                QPushButton {{
-                    background: {SURFACE0}; color: {color};
-                    border: 1px solid {SURFACE1}; border-radius: 6px;
-                    padding: 5px 14px; font-size: 13px; font-weight: 600;
-                }}
-                QPushButton:hover {{ background: {color}; color: {CRUST}; }}
-                QPushButton:pressed {{ background: {color}; color: {CRUST}; }}
-            """)
+        qss = _build_main_qss(_SPIN_UP_URI, _SPIN_DOWN_URI)
+        # setStyleSheet re-polishes every child widget, so skip a no-op reapply
+        qss_hash = hash(qss)
+        if qss_hash == self._last_qss_hash:
+            return
+        self._last_qss_hash = qss_hash
+        # Accent buttons are styled by their "accent" property, set in
+        # _make_button before this first polish
+        self.setStyleSheet(qss)
 
     # -----------------------------------------------------------------------
     # Global hotkeys
     # -----------------------------------------------------------------------
     def _invoke_ui(self, fn, *args, **kwargs):
-        QTimer.singleShot(0, lambda: fn(*args, **kwargs))
+        # A queued signal needs no timer, unlike QTimer.singleShot(0, ...)
+        self._ui_dispatch.emit(fn, args, kwargs)
 
-    def _make_hotkey_callback(self, fn):
-        return lambda: self._invoke_ui(fn)
+    def _run_on_ui(self, fn, args, kwargs):
+        fn(*args, **kwargs)
 
     def _register_global_hotkeys(self):
+        # Saving the hotkey dialog without edits shouldn't re-grab every key
+        if self._hotkeys == self._last_registered:
+            return
         self._unregister_global_hotkeys()
-        callbacks = {
-            "start": self._on_start,
-            "pause": self._on_pause,
-            "skip": self._on_skip,
-            "stop": self._on_stop,
-        }
+        callbacks = self._hotkey_actions
 
         if _IS_WINDOWS:
             if self._win_hotkeys is None:
@@ -1870,6 +2544,7 @@ class HumanTextEditor(QMainWindow):
                 names = ", ".join(f"{a.capitalize()}={self._hotkeys[a]}" for a in success)
                 self._append_log(f"Hotkeys registered (Windows): {names}")
             if not failed:
+                self._last_registered = dict(self._hotkeys)
                 return
             self._append_log(
                 "Some hotkeys could not be registered by Windows; attempting keyboard fallback."
@@ -1883,21 +2558,25 @@ class HumanTextEditor(QMainWindow):
                 if _IS_WINDOWS and self._win_hotkeys is not None and action not in failed:
                     continue
                 kb_combo = "+".join(p.strip().lower() for p in key_combo.split("+"))
-                callback = callbacks.get(action)
+                callback = self._hotkey_callbacks.get(action)
                 if callback:
-                    hook = _kb.add_hotkey(kb_combo, self._make_hotkey_callback(callback), suppress=False)
-                    self._hotkey_hooks.append(hook)
+                    self._hotkey_hooks[action] = _kb.add_hotkey(
+                        kb_combo, callback, suppress=False
+                    )
             names = ", ".join(f"{a.capitalize()}={k}" for a, k in self._hotkeys.items())
             self._append_log(f"Hotkeys registered: {names}")
+            # Only a fully bound map may skip the next registration.
+            self._last_registered = dict(self._hotkeys)
         except Exception as exc:
             self._append_log(f"Hotkey registration error: {exc}")
 
     def _unregister_global_hotkeys(self):
+        self._last_registered = {}
         if _IS_WINDOWS and self._win_hotkeys is not None:
             self._win_hotkeys.unregister_all()
         if not _keyboard_available:
             return
-        for hook in self._hotkey_hooks:
+        for hook in self._hotkey_hooks.values():
             try:
                 _kb.remove_hotkey(hook)
             except Exception:
@@ -1909,17 +2588,14 @@ class HumanTextEditor(QMainWindow):
     # -----------------------------------------------------------------------
     def _toggle_settings(self):
         self._settings_expanded = not self._settings_expanded
+        self._mark_dirty()
         self._settings_widget.setVisible(self._settings_expanded)
-        self._settings_toggle.setText(
-            "▼ Settings" if self._settings_expanded else "▶ Settings"
-        )
+        self._settings_toggle.setText(self._SETTINGS_LABELS[self._settings_expanded])
 
     def _toggle_log(self):
         self._log_visible = not self._log_visible
         self._log_widget.setVisible(self._log_visible)
-        self._log_toggle.setText(
-            "▼ Activity Log" if self._log_visible else "▶ Activity Log"
-        )
+        self._log_toggle.setText(self._LOG_LABELS[self._log_visible])
 
     # -----------------------------------------------------------------------
     # Mode switching
@@ -1931,13 +2607,13 @@ class HumanTextEditor(QMainWindow):
         if is_replace:
             self._update_manual_progress(
                 self._manual_start_pos_replace,
-                len(self._original_text.toPlainText()),
+                self._text_length(self._original_text),
                 "Replace",
             )
         else:
             self._update_manual_progress(
                 self._manual_start_pos_fresh,
-                len(self._your_text.toPlainText()),
+                self._text_length(self._your_text),
                 "Fresh",
             )
 
@@ -1945,50 +2621,79 @@ class HumanTextEditor(QMainWindow):
     # Diff preview
     # -----------------------------------------------------------------------
     def _build_diff_preview(self):
-        orig = self._original_text.toPlainText()
-        repl = self._replacement_text.toPlainText()
-        if not orig and not repl:
+        self._diff_timer.start()
+
+    def _on_diff_input_changed(self):
+        # Keep a preview that is already showing in step with the edits
+        if self._diff_shown != ("", "") or self._diff_timer.isActive():
+            self._diff_timer.start()
+
+    def _build_diff_preview_impl(self):
+        self._diff_request += 1
+        if (self._original_text.document().isEmpty()
+                and self._replacement_text.document().isEmpty()):
             self._diff_view.clear()
+            self._diff_shown = ("", "")
+            self._finish_diff_preview()
+            return
+        orig = self._plain_text(self._original_text)
+        repl = self._plain_text(self._replacement_text)
+        if (orig, repl) == self._diff_shown:
+            self._finish_diff_preview()  # Already on screen
             return
 
-        ops = _compute_diff(orig, repl)
-        parts: list[str] = []
-        for op in ops:
-            if op.kind == "equal":
-                txt = html.escape(op.new_text)
-                txt = txt.replace("\t", "    ").replace("\n", "<br>")
-                parts.append(
-                    f"<span style='background:{SURFACE0}; color:{TEXT};'>" + txt + "</span>"
-                )
-            elif op.kind == "delete":
-                txt = html.escape(op.old_text)
-                txt = txt.replace("\t", "    ").replace("\n", "<br>")
-                parts.append(
-                    f"<span style='background:#44{RED[1:]}; color:{RED}; text-decoration:line-through;'>"
-                    + txt + "</span>"
-                )
-            elif op.kind == "insert":
-                txt = html.escape(op.new_text)
-                txt = txt.replace("\t", "    ").replace("\n", "<br>")
-                parts.append(
-                    f"<span style='background:#44{GREEN[1:]}; color:{GREEN};'>" + txt + "</span>"
-                )
-            elif op.kind == "replace":
-                old_txt = html.escape(op.old_text).replace("\t", "    ").replace("\n", "<br>")
-                new_txt = html.escape(op.new_text).replace("\t", "    ").replace("\n", "<br>")
-                parts.append(
-                    f"<span style='background:#44{RED[1:]}; color:{RED}; text-decoration:line-through;'>"
-                    + old_txt + "</span>"
-                )
-                parts.append(
-                    f"<span style='background:#44{GREEN[1:]}; color:{GREEN};'>" + new_txt + "</span>"
-                )
-
-        html_doc = (
-            "<div style='white-space: pre-wrap; font-family: Cascadia Code, Consolas, monospace; "
-            "font-size: 11px;'>" + "".join(parts) + "</div>"
+        if self._preview_btn.isEnabled():
+            self._diff_status = self._status_label.text()
+            self._preview_btn.setEnabled(False)
+        self._status_label.setText("Computing diff…")
+        self._diff_pending = (orig, repl)
+        QThreadPool.globalInstance().start(
+            DiffTask(self._diff_request, orig, repl, self._diff_signals)
         )
-        self._diff_view.setHtml(html_doc)
+
+    def _on_diff_ready(self, request_id: int, ops: list):
+        if request_id != self._diff_request:
+            return  # Superseded by a newer preview
+        # Insert the runs straight into the view's document: no HTML to
+        # build, escape and re-parse
+        formats = _diff_formats()
+        eq_fmt, del_fmt, ins_fmt = formats["equal"], formats["delete"], formats["insert"]
+        doc = self._diff_view.document()
+        doc.clear()
+        cursor = QTextCursor(doc)
+        cursor.beginEditBlock()
+        insert = cursor.insertText
+        for op in ops:
+            kind = op.kind
+            if kind == "equal":
+                insert(op.new_text, eq_fmt)
+            elif kind == "delete":
+                insert(op.old_text, del_fmt)
+            elif kind == "insert":
+                insert(op.new_text, ins_fmt)
+            elif kind == "replace":
+                insert(op.old_text, del_fmt)
+                insert(op.new_text, ins_fmt)
+        cursor.endEditBlock()
+        self._diff_cache = (*self._diff_pending, ops)
+        self._diff_shown = self._diff_pending
+        self._finish_diff_preview()
+
+    def _diff_ops_for(self, orig: str, repl: str) -> list[DiffOp]:
+        """Diff ops for the two texts, reusing the last preview's when they match."""
+        cache = self._diff_cache
+        # The plain-text cache hands back the same str objects, so this
+        # compare is an identity check unless the texts were edited
+        if cache is not None and cache[0] == orig and cache[1] == repl:
+            return cache[2]
+        return _compute_diff(orig, repl)
+
+    def _finish_diff_preview(self):
+        if not self._preview_btn.isEnabled():
+            self._preview_btn.setEnabled(True)
+            # Leave the label alone if the worker reported something since
+            if self._status_label.text() == "Computing diff…":
+                self._status_label.setText(self._diff_status)
 
     # -----------------------------------------------------------------------
     # Actions
@@ -1997,8 +2702,8 @@ class HumanTextEditor(QMainWindow):
         dlg = HotkeyDialog(self._hotkeys, self)
         if dlg.exec() == QDialog.DialogCode.Accepted:
             self._hotkeys = dlg.hotkeys
-            self._settings["hotkeys"] = self._hotkeys
-            _save_settings(self._settings)
+            self._mark_dirty()
+            self._persist_all()
             self._register_global_hotkeys()
 
     def _on_support(self):
@@ -2013,17 +2718,17 @@ class HumanTextEditor(QMainWindow):
         orig = ""
 
         if is_replace:
-            orig = self._original_text.toPlainText()
-            repl = self._replacement_text.toPlainText()
+            orig = self._plain_text(self._original_text)
+            repl = self._plain_text(self._replacement_text)
             if not orig.strip() and not repl.strip():
                 self._append_log("No text to type.")
                 return
             text = repl
-            diff_ops = _compute_diff(orig, repl) if orig else None
+            diff_ops = self._diff_ops_for(orig, repl) if orig else None
             mode = "replace"
             start_pos = max(0, min(self._manual_start_pos_replace, len(orig)))
         else:
-            text = self._your_text.toPlainText()
+            text = self._plain_text(self._your_text)
             if not text.strip():
                 self._append_log("No text to type.")
                 return
@@ -2040,10 +2745,10 @@ class HumanTextEditor(QMainWindow):
         )
 
         self._worker = TypingWorker(text, options, mode, diff_ops, start_pos=start_pos)
+        self._run_start_pos = start_pos
         self._worker.signals.status.connect(self._on_status)
-        self._worker.signals.log.connect(self._append_log)
+        self._worker.signals.log_batch.connect(self._append_log_lines)
         self._worker.signals.progress.connect(self._on_progress)
-        self._worker.signals.char_typed.connect(self._on_char_typed)
         self._worker.signals.finished.connect(self._on_finished)
         self._worker.signals.cursor_pos.connect(self._on_cursor_pos)
         self._worker.signals.pause_info.connect(self._on_pause_info)
@@ -2080,6 +2785,8 @@ class HumanTextEditor(QMainWindow):
         if self._worker:
             self._worker.stop()
             self._append_log("Stop requested.")
+        self._cursor_timer.stop()
+        self._pending_cursor_pos = None
         self._reset_cursors_to_start()
 
     def _on_skip(self):
@@ -2097,32 +2804,57 @@ class HumanTextEditor(QMainWindow):
         self._progress_bar.setValue(pct)
         self._status_label.setText(f"Typing… {pct}%")
 
-    def _on_char_typed(self, ch: str):
-        pass
-
     def _on_cursor_pos(self, pos: int):
-        """Move the animated cursor overlay to the given character position."""
+        """Queue a move of the animated cursor overlay to *pos*."""
+        if self._worker is not None and self._worker._stopped:
+            return  # Stop already reset the cursors to the start
+        self._pending_cursor_pos = pos
+        if not self._cursor_timer.isActive():
+            self._cursor_timer.start()
+
+    def _apply_cursor_pos(self):
+        pos, self._pending_cursor_pos = self._pending_cursor_pos, None
+        if pos is None:
+            return
+        # The editors' own cursors don't follow typing, so keep the manual
+        # start position in step here; resuming or "start from cursor"
+        # after a pause then picks up where typing stopped
         is_replace = self._mode_combo.currentIndex() == 1
         if is_replace:
+            self._manual_start_pos_replace = pos
             self._orig_cursor.set_position(pos)
         else:
+            self._manual_start_pos_fresh = pos
             self._fresh_cursor.set_position(pos)
 
     def _on_pause_info(self, pos: int, snippet: str):
-        """Show a popup and log entry with the exact pause position."""
+        """Show a toast and log entry with the exact pause position."""
         self._append_log(f"Paused at position {pos}: {snippet}")
-        # Show a non-blocking message
-        QMessageBox.information(
-            self,
-            "Typing Paused",
-            f"Paused at character {pos}.\n\n{snippet}",
-        )
+        # Reuse one non-modal toast; repeated pauses just refresh it
+        toast = self._pause_toast
+        toast.setText(f"Typing paused at character {pos}.\n\n{snippet}")
+        toast.adjustSize()
+        center = self.frameGeometry().center()
+        toast.move(center.x() - toast.width() // 2, center.y() - toast.height() // 2)
+        toast.show()
+        self._toast_timer.start()
 
     def _on_finished(self):
+        stopped = self._worker is not None and self._worker._stopped
         self._worker = None
+        self._pause_toast.hide()
         self._set_running_ui(False)
         self._status_label.setText("Ready")
         self._progress_bar.setValue(0)
+        self._cursor_timer.stop()
+        self._pending_cursor_pos = None
+        # Reports only steer resuming mid-run; a finished run leaves the
+        # manual start where it began (Stop has already reset it)
+        if not stopped:
+            if self._mode_combo.currentIndex() == 1:
+                self._manual_start_pos_replace = self._run_start_pos
+            else:
+                self._manual_start_pos_fresh = self._run_start_pos
         self._fresh_cursor.stop()
         self._orig_cursor.stop()
         self._append_log("Finished.")
@@ -2139,9 +2871,35 @@ class HumanTextEditor(QMainWindow):
     # -----------------------------------------------------------------------
     # Logging
     # -----------------------------------------------------------------------
+    def _timestamp(self) -> str:
+        """HH:MM:SS for log lines, formatted once per second."""
+        now = int(time.time())
+        if now != self._ts_second:
+            t = time.localtime(now)
+            self._ts_second = now
+            self._ts_text = f"{t.tm_hour:02d}:{t.tm_min:02d}:{t.tm_sec:02d}"
+        return self._ts_text
+
     def _append_log(self, msg: str):
-        ts = time.strftime("%H:%M:%S")
-        self._log.appendPlainText(f"[{ts}] {msg}")
+        ts = self._timestamp()
+        self._queue_log_lines([f"[{ts}] {msg}"])
+
+    def _append_log_lines(self, lines: list):
+        ts = self._timestamp()
+        self._queue_log_lines([f"[{ts}] {msg}" for msg in lines])
+
+    def _queue_log_lines(self, lines: list):
+        # Lines are stamped on arrival but appended in one go per flush
+        self._log_lines += lines
+        if not self._log_flush_timer.isActive():
+            self._log_flush_timer.start()
+
+    def _flush_log_lines(self):
+        if self._log_lines:
+            text = "\n".join(self._log_lines)
+            self._log_lines.clear()
+            # One append (and one block-count trim) per flush
+            self._log.appendPlainText(text)
 
     # -----------------------------------------------------------------------
     # Cleanup
@@ -2150,7 +2908,9 @@ class HumanTextEditor(QMainWindow):
         if self._worker:
             self._worker.stop()
         self._unregister_global_hotkeys()
-        self._persist_all()
+        # Let queued saves land first; diff previews are not waited for
+        self._save_pool.waitForDone()
+        self._persist_all(blocking=True)
         super().closeEvent(event)
 
 
@@ -0,0 +1,65 @@
+# Resource object code (Python 3)
+# Created by: object code
+# Created by: The Resource Compiler for Qt version 6.7.3
+# WARNING! All changes made in this file will be lost!
+
+from PySide6 import QtCore
+
+qt_resource_data = b"\
+\x00\x00\x00\x88\
+<\
+svg xmlns=\x22http:\
+//www.w3.org/200\
+0/svg\x22 width=\x2210\
+\x22 height=\x2210\x22 vi\
+ewBox=\x220 0 10 10\
+\x22><polygon point\
+s=\x225,8 9,2 1,2\x22 \
+fill=\x22#cdd6f4\x22/>\
+</svg>\x0a\
+\x00\x00\x00\x88\
+<\
+svg xmlns=\x22http:\
+//www.w3.org/200\
+0/svg\x22 width=\x2210\
+\x22 height=\x2210\x22 vi\
+ewBox=\x220 0 10 10\
+\x22><polygon point\
+s=\x225,2 9,8 1,8\x22 \
+fill=\x22#cdd6f4\x22/>\
+</svg>\x0a\
+"
+
+qt_resource_name = b"\
+\x00\x06\
+\x06\x89\x96\xe3\
+\x00a\
+\x00r\x00r\x00o\x00w\x00s\
+\x00\x08\
+\x06\xe1W\xa7\
+\x00d\
+\x00o\x00w\x00n\x00.\x00s\x00v\x00g\
+\x00\x06\
+\x07\xc3Z\xc7\
+\x00u\
+\x00p\x00.\x00s\x00v\x00g\
+"
+
+qt_resource_struct = b"\
+\x00\x00\x00\x00\x00\x02\x00\x00\x00\x01\x00\x00\x00\x01\
+\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x02\x00\x00\x00\x02\x00\x00\x00\x02\
+\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x12\x00\x00\x00\x00\x00\x01\x00\x00\x00\x00\
+\x00\x00\x01\xa1;\xbc\xa9\xbf\
+\x00\x00\x00(\x00\x00\x00\x00\x00\x01\x00\x00\x00\x8c\
+\x00\x00\x01\xa1;\xbc\xa9\xbf\
+"
+
+def qInitResources():
+    QtCore.qRegisterResourceData(0x03, qt_resource_struct, qt_resource_name, qt_resource_data)
+
+def qCleanupResources():
+    QtCore.qUnregisterResourceData(0x03, qt_resource_struct, qt_resource_name, qt_resource_data)
+
+qInitResources()
@@ -4,7 +4,7 @@ $root = Split-Path -Parent $PSScriptRoot
 Push-Location $root
 try {
     Write-Host "Building EXE..."
-    python .\build_exe.py
+    python .\build_exe.py --release
 
     Write-Host "Building installer..."
     $iscc = (Get-Command iscc -ErrorAction SilentlyContinue).Source
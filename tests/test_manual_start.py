@@ -0,0 +1,75 @@
+"""Starting a second run picks up from the same manual start as the first."""
+
+import os
+import sys
+import time
+from pathlib import Path
+
+import pytest
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+pytest.importorskip("PySide6")
+pyautogui = pytest.importorskip("pyautogui")
+
+from PySide6.QtWidgets import QApplication  # noqa: E402
+
+import human_editor as he  # noqa: E402
+
+
+@pytest.fixture
+def window(tmp_path, monkeypatch):
+    monkeypatch.setattr(he, "_SETTINGS_FILE", tmp_path / "hte_settings.json")
+    # Record key presses instead of sending them to the desktop
+    typed: list[str] = []
+    for name in ("press", "keyDown", "keyUp", "hotkey"):
+        monkeypatch.setattr(pyautogui, name, lambda *a, **k: None)
+    monkeypatch.setattr(pyautogui, "write", lambda s, interval=0: typed.append(s))
+    monkeypatch.setattr(pyautogui, "failSafeCheck", lambda: None)
+    monkeypatch.setattr(he, "_send_char", lambda ch: typed.append(ch) or True, raising=False)
+    monkeypatch.setattr(he, "_send_text", lambda s: typed.append(s) or len(s), raising=False)
+    app = QApplication.instance() or QApplication([])
+    w = he.HumanTextEditor()
+    w._countdown_spin.setValue(0)
+    w._type_combo.setCurrentText("Bot")
+    w.typed = typed
+    yield w
+    w._worker = None
+    w.close()
+    app.processEvents()
+
+
+def _run_to_end(app_window, timeout: float = 10.0):
+    app = QApplication.instance()
+    app_window._on_start()
+    assert app_window._worker is not None
+    deadline = time.monotonic() + timeout
+    while app_window._worker is not None and time.monotonic() < deadline:
+        app.processEvents()
+        time.sleep(0.01)
+    assert app_window._worker is None, "run did not finish"
+
+
+def test_fresh_start_twice(window):
+    window._mode_combo.setCurrentIndex(0)
+    window._your_text.setPlainText("hello world, typed twice")
+    _run_to_end(window)
+    assert window._manual_start_pos_fresh == 0
+    first = "".join(window.typed)
+    window.typed.clear()
+    _run_to_end(window)
+    assert window._manual_start_pos_fresh == 0
+    assert "".join(window.typed) == first
+
+
+def test_replace_start_twice(window):
+    window._mode_combo.setCurrentIndex(1)
+    window._original_text.setPlainText("the quick brown fox jumps")
+    window._replacement_text.setPlainText("the slow brown cat jumps high")
+    _run_to_end(window)
+    assert window._manual_start_pos_replace == 0
+    first = "".join(window.typed)
+    window.typed.clear()
+    _run_to_end(window)
+    assert window._manual_start_pos_replace == 0
+    assert "".join(window.typed) == first